@@ -6,24 +6,134 @@ Creates realistic product data for demonstration purposes.
 This simulates the structure and variety of real scraped data.
 """
 
-import random
 import json
-from datetime import datetime, timedelta
+import math
+import time
+from dataclasses import dataclass, fields
+import numpy as np
+from datetime import datetime
 from pathlib import Path
-import sys
-import os
+from typing import Optional
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# orjson serializes datetimes natively in C; fall back to the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
-from src.utils.config import load_config
-from src.data.database import DatabaseManager
+try:
+    import zstandard as zstd
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstd = None
+    ZSTD_AVAILABLE = False
+
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    tqdm = None
+    TQDM_AVAILABLE = False
+
+# Seconds between progress lines when tqdm is not installed
+PROGRESS_INTERVAL = 2.0
+
+# Field order of materialized product rows
+ROW_FIELDS = (
+    'source', 'title', 'price', 'rating', 'url', 'search_keyword', 'page_number',
+    'position_on_page', 'scraped_at', 'scraper_type', 'product_id'
+)
+
+@dataclass
+class ProductColumns:
+    """Column-oriented demo products: one NumPy array per field."""
+    source: np.ndarray
+    title: np.ndarray
+    price: np.ndarray
+    rating: np.ndarray
+    product_id: np.ndarray
+    search_keyword: np.ndarray
+    page_number: np.ndarray
+    position_on_page: np.ndarray
+    scraped_at: np.ndarray
+    scraper_type: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.price)
+    
+    def select(self, index) -> 'ProductColumns':
+        """Return the rows picked by a slice, mask or index array."""
+        return ProductColumns(**{f.name: getattr(self, f.name)[index] for f in fields(self)})
+    
+    def rows(self, start: int = 0, stop: int = None) -> list:
+        """Materialize rows [start, stop) as tuples in ROW_FIELDS order."""
+        part = self.select(slice(start, stop))
+        return [
+            (source, title, price, rating, f"https://{source}.com/product/{pid}", keyword,
+             page, position, scraped_at, scraper_type, f"{source}_{pid}")
+            for source, title, price, rating, pid, keyword, page, position, scraped_at, scraper_type in zip(
+                part.source.tolist(), part.title.tolist(), part.price.tolist(), part.rating.tolist(),
+                part.product_id.tolist(), part.search_keyword.tolist(), part.page_number.tolist(),
+                part.position_on_page.tolist(), part.scraped_at.tolist(), part.scraper_type.tolist()
+            )
+        ]
+    
+    @staticmethod
+    def as_dict(row: tuple) -> dict:
+        """Convert a row tuple into a product dictionary."""
+        return dict(zip(ROW_FIELDS, row))
+    
+    def to_dicts(self, start: int = 0, stop: int = None) -> list:
+        """Materialize rows [start, stop) as product dictionaries."""
+        return [dict(zip(ROW_FIELDS, row)) for row in self.rows(start, stop)]
+    
+    def db_rows(self, start: int = 0, stop: int = None) -> dict:
+        """
+        Build database rows [start, stop) straight from the column arrays.
+        
+        Returns:
+            Product column values keyed by (source, product_id), as taken by
+            DatabaseManager.save_product_rows()
+        """
+        from src.utils.helpers import generate_hash
+        
+        part = self.select(slice(start, stop))
+        scraped_at = part.scraped_at.astype('datetime64[s]').tolist()
+        db_rows = {}
+        for source, title, price, rating, pid, keyword, page, position, scraped, scraper_type in zip(
+            part.source.tolist(), part.title.tolist(), part.price.tolist(), part.rating.tolist(),
+            part.product_id.tolist(), part.search_keyword.tolist(), part.page_number.tolist(),
+            part.position_on_page.tolist(), scraped_at, part.scraper_type.tolist()
+        ):
+            product_id = f"{source}_{pid}"
+            db_rows[(source, product_id)] = {
+                'source': source, 'title': title, 'price': price, 'rating': rating,
+                'url': f"https://{source}.com/product/{pid}", 'search_keyword': keyword,
+                'page_number': page, 'position_on_page': position, 'scraped_at': scraped,
+                'scraper_type': scraper_type, 'product_id': product_id,
+                'data_hash': generate_hash(f"{source}-{product_id}-{title}")
+            }
+        return db_rows
+
+# Title variations; each group is picked with equal probability
+TITLE_COLORS = ('Black', 'White', 'Silver', 'Blue', 'Red')
+TITLE_SUFFIXES = ('Pro', 'Plus', 'Max', 'Ultra', 'Lite')
+TITLE_YEARS = ('2024', '2023', 'Latest', 'New')
 
 class DemoDataGenerator:
     """Generate realistic demo product data."""
     
-    def __init__(self):
-        """Initialize demo data generator."""
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize demo data generator.
+        
+        Args:
+            seed: Optional seed for reproducible datasets
+        """
+        # Instance RNG avoids the shared module-level random state
+        self._np_rng = np.random.default_rng(seed)
         self.sources = ['amazon', 'ebay', 'walmart']
         
         self.product_templates = {
@@ -80,167 +190,250 @@ class DemoDataGenerator:
         }
         
         self.keywords = list(self.product_templates.keys())
-    
-    def generate_product(self, keyword: str, source: str) -> dict:
-        """Generate a single realistic product."""
-        template = self.product_templates[keyword]
-        
-        # Random title with variations
-        base_title = random.choice(template['titles'])
-        variations = [
-            f"{base_title} - {random.choice(['Black', 'White', 'Silver', 'Blue', 'Red'])}",
-            f"{base_title} {random.choice(['Pro', 'Plus', 'Max', 'Ultra', 'Lite'])}",
-            f"{base_title} ({random.choice(['2024', '2023', 'Latest', 'New'])})",
-            base_title
-        ]
-        title = random.choice(variations)
-        
-        # Price with source variation
-        price_min, price_max = template['price_range']
-        base_price = random.uniform(price_min, price_max)
-        
-        # Source-specific price adjustments
-        if source == 'amazon':
-            price = base_price * random.uniform(0.95, 1.1)
-        elif source == 'ebay':
-            price = base_price * random.uniform(0.8, 1.15)  # More variation on eBay
-        else:  # walmart
-            price = base_price * random.uniform(0.9, 1.05)
-        
-        # Rating
-        rating_min, rating_max = template['rating_range']
-        rating = round(random.uniform(rating_min, rating_max), 1)
-        
-        # URL
-        product_id = random.randint(100000, 999999)
-        url = f"https://{source}.com/product/{product_id}"
         
-        # Timestamp (spread over last 30 days)
-        days_ago = random.randint(0, 30)
-        scraped_at = datetime.now() - timedelta(days=days_ago)
+        # Pre-built title variations, so picking a title is a single choice
+        self._title_pool = {
+            keyword: self._build_title_pool(template['titles'])
+            for keyword, template in self.product_templates.items()
+        }
         
-        return {
-            'source': source,
-            'title': title,
-            'price': round(price, 2),
-            'rating': rating,
-            'url': url,
-            'search_keyword': keyword,
-            'page_number': random.randint(1, 10),
-            'position_on_page': random.randint(1, 20),
-            'scraped_at': scraped_at,
-            'scraper_type': random.choice(['static', 'selenium']),
-            'product_id': f"{source}_{product_id}"
+        # Keyword-indexed arrays used by the vectorized generator
+        templates = [self.product_templates[keyword] for keyword in self.keywords]
+        pool_sizes = np.array([len(self._title_pool[keyword]) for keyword in self.keywords])
+        self._lookup_tables = {
+            'keywords': np.array(self.keywords, dtype=object),
+            'price_bounds': np.array([t['price_range'] for t in templates], dtype=float),
+            'rating_bounds': np.array([t['rating_range'] for t in templates], dtype=float),
+            'pool_sizes': pool_sizes,
+            'pool_offsets': np.concatenate(([0], np.cumsum(pool_sizes)[:-1])),
+            'title_pool': np.array(
+                [title for keyword in self.keywords for title in self._title_pool[keyword]],
+                dtype=object
+            )
         }
     
-    def generate_dataset(self, target_count: int = 5000) -> list:
-        """Generate complete dataset."""
-        products = []
+    @staticmethod
+    def _build_title_pool(titles: list) -> tuple:
+        """
+        Expand base titles into every color, suffix and year variation.
+        
+        Each variation group is repeated up to a common size so a uniform pick
+        from the pool keeps the four groups (color, suffix, year, bare title)
+        equally likely, matching the original per-group sampling.
+        """
+        group_size = math.lcm(len(TITLE_COLORS), len(TITLE_SUFFIXES), len(TITLE_YEARS))
+        pool = []
+        for base in titles:
+            groups = [
+                [f"{base} - {c}" for c in TITLE_COLORS],
+                [f"{base} {s}" for s in TITLE_SUFFIXES],
+                [f"{base} ({y})" for y in TITLE_YEARS],
+                [base]
+            ]
+            for group in groups:
+                pool.extend(group * (group_size // len(group)))
+        return tuple(pool)
+    
+    def generate_product(self, keyword: str, source: str) -> dict:
+        """Generate a single realistic product."""
+        keyword_idx = np.array([self.keywords.index(keyword)])
+        return self._generate_columns(keyword_idx, self._np_rng, source=source).to_dicts()[0]
+    
+    def generate_dataset(self, target_count: int = 5000) -> ProductColumns:
+        """Generate complete dataset as product columns."""
+        rng = self._np_rng
         
         print(f"🔄 Generating {target_count:,} demo products...")
         
-        # Distribute products across keywords and sources
+        # Distribute products across keywords, spreading the remainder randomly
         products_per_keyword = target_count // len(self.keywords)
+        remaining = target_count - products_per_keyword * len(self.keywords)
+        counts = products_per_keyword + np.bincount(
+            rng.integers(0, len(self.keywords), remaining), minlength=len(self.keywords)
+        )
         
-        for keyword in self.keywords:
-            print(f"📝 Generating {keyword} products...")
-            
-            for _ in range(products_per_keyword):
-                source = random.choice(self.sources)
-                product = self.generate_product(keyword, source)
-                products.append(product)
-        
-        # Add remaining products to reach exact target
-        remaining = target_count - len(products)
-        for _ in range(remaining):
-            keyword = random.choice(self.keywords)
-            source = random.choice(self.sources)
-            product = self.generate_product(keyword, source)
-            products.append(product)
+        # Every column is drawn at full size in one pass over all keywords
+        keyword_idx = np.repeat(np.arange(len(self.keywords)), counts)
+        products = self._generate_columns(keyword_idx, rng)
         
         print(f"✅ Generated {len(products):,} products")
         return products
     
-    def save_to_database(self, products: list, config: dict) -> int:
-        """Save products to database."""
+    def _generate_columns(
+        self,
+        keyword_idx: np.ndarray,
+        rng: np.random.Generator,
+        source: Optional[str] = None
+    ) -> ProductColumns:
+        """
+        Generate products with vectorized sampling.
+        
+        Args:
+            keyword_idx: Index into self.keywords for each product to generate
+            rng: NumPy random generator
+            source: Fixed source for every product; random per product if None
+        """
+        n = len(keyword_idx)
+        tables = self._lookup_tables
+        
+        # Per-keyword lookup tables, broadcast to one value per product
+        price_bounds = tables['price_bounds'][keyword_idx]
+        rating_bounds = tables['rating_bounds'][keyword_idx]
+        pool_sizes = tables['pool_sizes'][keyword_idx]
+        title_idx = tables['pool_offsets'][keyword_idx] + (rng.random(n) * pool_sizes).astype(np.int64)
+        
+        # Prices with source-specific adjustments (eBay varies the most)
+        if source is None:
+            sources = np.array(self.sources, dtype=object)[rng.integers(0, len(self.sources), n)]
+        else:
+            sources = np.full(n, source, dtype=object)
+        base_price = rng.uniform(price_bounds[:, 0], price_bounds[:, 1])
+        multiplier = np.select(
+            [sources == 'amazon', sources == 'ebay'],
+            [rng.uniform(0.95, 1.1, n), rng.uniform(0.8, 1.15, n)],
+            default=rng.uniform(0.9, 1.05, n)
+        )
+        
+        # Timestamps spread over the last 30 days
+        now = np.datetime64(datetime.now(), 's')
+        days_ago = rng.integers(0, 31, n)
+        
+        return ProductColumns(
+            source=sources,
+            title=tables['title_pool'][title_idx],
+            price=np.round(base_price * multiplier, 2),
+            rating=np.round(rng.uniform(rating_bounds[:, 0], rating_bounds[:, 1]), 1),
+            product_id=rng.integers(100000, 1000000, n),
+            search_keyword=tables['keywords'][keyword_idx],
+            page_number=rng.integers(1, 11, n),
+            position_on_page=rng.integers(1, 21, n),
+            # Pre-serialized ISO 8601 strings keep JSON encoding on the fast path
+            scraped_at=np.datetime_as_string(now - days_ago.astype('timedelta64[D]'), unit='s').astype(object),
+            scraper_type=np.array(['static', 'selenium'], dtype=object)[rng.integers(0, 2, n)]
+        )
+    
+    def save_to_database(self, products: ProductColumns, config: dict, batch_size: int = 10000) -> int:
+        """Save products to database in bulk batches."""
         print("💾 Saving to database...")
         
+        from src.data.database import DatabaseManager
+        
         db_manager = DatabaseManager(config)
         saved_count = 0
-        
-        for i, product in enumerate(products):
-            try:
-                if db_manager.save_product(product):
-                    saved_count += 1
-                
-                if (i + 1) % 500 == 0:
-                    print(f"📊 Saved {saved_count:,}/{i+1:,} products...")
+        progress = tqdm(total=len(products), unit='row', desc='Saving') if TQDM_AVAILABLE else None
+        last_report = time.monotonic()
+        
+        try:
+            # One connection and one transaction for the whole dataset
+            with db_manager.bulk_context() as session:
+                for start in range(0, len(products), batch_size):
+                    stop = min(start + batch_size, len(products))
+                    saved_count += db_manager.save_product_rows(products.db_rows(start, stop), session=session)
                     
-            except Exception as e:
-                print(f"⚠️ Failed to save product {i}: {e}")
-                continue
+                    if progress is not None:
+                        progress.update(stop - start)
+                    elif time.monotonic() - last_report >= PROGRESS_INTERVAL:
+                        print(f"📊 Saved {saved_count:,}/{stop:,} products...")
+                        last_report = time.monotonic()
+        except Exception as e:
+            print(f"❌ Database save failed, transaction rolled back: {e}")
+            saved_count = 0
+        finally:
+            if progress is not None:
+                progress.close()
         
         print(f"✅ Saved {saved_count:,} products to database")
         return saved_count
     
-    def save_to_files(self, products: list, output_dir: str = 'data_output/demo'):
-        """Save products to JSON files."""
+    def save_to_files(self, products: ProductColumns, output_dir: str = 'data_output/demo', compress: bool = True):
+        """
+        Save products to JSON files.
+        
+        Args:
+            products: Generated product columns
+            output_dir: Directory for the output files
+            compress: Write zstd-compressed .json.zst files when zstandard is installed
+        """
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
+        compress = compress and ZSTD_AVAILABLE
+        extension = '.json.zst' if compress else '.json'
         
         # Save complete dataset
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        complete_file = output_path / f'demo_products_{timestamp}.json'
+        complete_file = output_path / f'demo_products_{timestamp}{extension}'
         
-        with open(complete_file, 'w', encoding='utf-8') as f:
-            json.dump(products, f, indent=2, default=str, ensure_ascii=False)
+        records = products.to_dicts()
+        self._write_json(complete_file, records, compress)
         
         print(f"💾 Complete dataset saved: {complete_file}")
         
+        # Group the already-built records by source in a single pass
+        buckets = {source: [] for source in self.sources}
+        for record in records:
+            bucket = buckets.get(record['source'])
+            if bucket is not None:
+                bucket.append(record)
+        
         # Save by source
-        for source in self.sources:
-            source_products = [p for p in products if p['source'] == source]
-            source_file = output_path / f'{source}_products_{timestamp}.json'
+        for source, source_products in buckets.items():
+            source_file = output_path / f'{source}_products_{timestamp}{extension}'
             
-            with open(source_file, 'w', encoding='utf-8') as f:
-                json.dump(source_products, f, indent=2, default=str, ensure_ascii=False)
+            self._write_json(source_file, source_products, compress)
             
             print(f"📁 {source.title()} products: {len(source_products):,} saved to {source_file}")
     
-    def generate_statistics(self, products: list) -> dict:
-        """Generate dataset statistics."""
-        stats = {
+    def _write_json(self, file_path: Path, products: list, compress: bool = False) -> None:
+        """Write products as indented JSON, using orjson when available."""
+        if ORJSON_AVAILABLE:
+            data = orjson.dumps(products, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            data = json.dumps(products, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        with open(file_path, 'wb') as f:
+            if compress:
+                with zstd.ZstdCompressor(level=3).stream_writer(f) as writer:
+                    writer.write(data)
+            else:
+                f.write(data)
+    
+    def generate_statistics(self, products: ProductColumns) -> dict:
+        """Generate dataset statistics with column reductions."""
+        # Count each categorical column in one pass instead of one mask per value
+        source_counts = dict(zip(*np.unique(products.source, return_counts=True)))
+        keyword_counts = dict(zip(*np.unique(products.search_keyword, return_counts=True)))
+        
+        return {
             'total_products': len(products),
-            'sources': {},
-            'keywords': {},
+            'sources': {source: int(source_counts.get(source, 0)) for source in self.sources},
+            'keywords': {keyword: int(keyword_counts.get(keyword, 0)) for keyword in self.keywords},
             'price_stats': {
-                'min': min(p['price'] for p in products),
-                'max': max(p['price'] for p in products),
-                'avg': sum(p['price'] for p in products) / len(products)
+                'min': float(products.price.min()),
+                'max': float(products.price.max()),
+                'avg': float(products.price.mean())
             },
             'rating_stats': {
-                'min': min(p['rating'] for p in products),
-                'max': max(p['rating'] for p in products),
-                'avg': sum(p['rating'] for p in products) / len(products)
+                'min': float(products.rating.min()),
+                'max': float(products.rating.max()),
+                'avg': float(products.rating.mean())
             }
         }
-        
-        # Count by source
-        for source in self.sources:
-            stats['sources'][source] = len([p for p in products if p['source'] == source])
-        
-        # Count by keyword
-        for keyword in self.keywords:
-            stats['keywords'][keyword] = len([p for p in products if p['search_keyword'] == keyword])
-        
-        return stats
 
 def main():
     """Main execution function."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Demo Data Generator')
+    parser.add_argument('--no-compress', dest='compress', action='store_false',
+                        help='Write plain .json files instead of zstd-compressed .json.zst')
+    args = parser.parse_args()
+    
     print("🎯 Demo Data Generator for Multi-Source Data Collection")
     print("=" * 55)
     
     try:
+        from src.utils.config import load_config
+        
         # Load configuration
         config = load_config('config/settings.yaml')
         
@@ -252,7 +445,7 @@ def main():
         products = generator.generate_dataset(target_count)
         
         # Save to files
-        generator.save_to_files(products)
+        generator.save_to_files(products, compress=args.compress)
         
         # Save to database
         saved_count = generator.save_to_database(products, config)
@@ -4,26 +4,38 @@ eBay-Focused Data Collection Script
 Designed to systematically collect 5,000+ records from eBay
 """
 
-import sys
-import time
+import os
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
-# Add project root to path
-sys.path.append('.')
+# Keyword batches scraped concurrently; per-request politeness delays
+# are applied inside the scrapers themselves
+MAX_WORKERS = 4
 
-from src.scrapers.manager import ScrapingManager
-from src.utils.config import load_config
-from src.utils.logger import setup_logger
+# Minimum new records between progress checkpoints
+CHECKPOINT_RECORDS = 100
+
+def write_progress(progress_file: Path, progress: dict) -> None:
+    """Write a progress checkpoint atomically via a temp file and rename."""
+    tmp_file = progress_file.with_suffix('.tmp')
+    with open(tmp_file, 'w') as f:
+        json.dump(progress, f, indent=2)
+    os.replace(tmp_file, progress_file)
 
 def main():
     """Execute systematic eBay collection."""
     
+    # Imported here so the scraper stack only loads when collection runs
+    from src.scrapers.manager import ScrapingManager
+    from src.utils.config import load_config
+    from src.utils.logger import setup_logger
+    
     # Setup
     config = load_config('config/settings.yaml')
     logger = setup_logger(__name__)
-    manager = ScrapingManager(config)
     
     # Different keyword categories for diversity
     keyword_batches = [
@@ -53,26 +65,45 @@ def main():
     ]
     
     total_collected = 0
+    last_checkpoint = 0
     target = 5000
     output_dir = Path('data_output/ebay_systematic')
     output_dir.mkdir(parents=True, exist_ok=True)
     
     logger.info(f"🎯 Starting systematic eBay collection (target: {target:,} records)")
     
-    for batch_num, keywords in enumerate(keyword_batches, 1):
-        if total_collected >= target:
-            break
-            
+    # ScrapingManager keeps per-instance scrapers, sessions and stats, so
+    # each worker thread builds its own instead of sharing one
+    worker_state = threading.local()
+    
+    def scrape_batch(batch_num, keywords):
+        manager = getattr(worker_state, 'manager', None)
+        if manager is None:
+            manager = worker_state.manager = ScrapingManager(config)
+        
         logger.info(f"📦 Batch {batch_num}/{len(keyword_batches)}: {keywords}")
+        # Scrape this batch with multiple pages
+        return manager.scrape_all(
+            sources=['ebay'],
+            keywords=keywords,
+            max_pages=8,  # Go deeper for more records
+            output_dir=str(output_dir)
+        )
+    
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(scrape_batch, batch_num, keywords): (batch_num, keywords)
+            for batch_num, keywords in enumerate(keyword_batches, 1)
+        }
         
-        try:
-            # Scrape this batch with multiple pages
-            results = manager.scrape_all(
-                sources=['ebay'],
-                keywords=keywords,
-                max_pages=8,  # Go deeper for more records
-                output_dir=str(output_dir)
-            )
+        for future in as_completed(futures):
+            batch_num, keywords = futures[future]
+            
+            try:
+                results = future.result()
+            except Exception as e:
+                logger.error(f"❌ Batch {batch_num} failed: {e}")
+                continue
             
             batch_count = len(results)
             total_collected += batch_count
@@ -80,6 +111,10 @@ def main():
             logger.info(f"✅ Batch {batch_num} complete: {batch_count:,} records")
             logger.info(f"📊 Total progress: {total_collected:,}/{target:,} ({(total_collected/target)*100:.1f}%)")
             
+            reached = total_collected >= target
+            if not reached and total_collected - last_checkpoint < CHECKPOINT_RECORDS:
+                continue
+            
             # Save progress report
             progress = {
                 'timestamp': datetime.now().isoformat(),
@@ -91,22 +126,15 @@ def main():
                 'progress_percent': (total_collected/target)*100
             }
             
-            progress_file = output_dir / f'progress_batch_{batch_num:02d}.json'
-            with open(progress_file, 'w') as f:
-                json.dump(progress, f, indent=2)
+            write_progress(output_dir / f'progress_batch_{batch_num:02d}.json', progress)
+            last_checkpoint = total_collected
             
-            if total_collected >= target:
+            if reached:
                 logger.info(f"🎉 TARGET ACHIEVED! Collected {total_collected:,} records")
+                # Drop batches that have not started yet
+                for pending in futures:
+                    pending.cancel()
                 break
-                
-            # Delay between batches to be respectful
-            delay = 60  # 1 minute between batches
-            logger.info(f"⏱️ Batch delay: {delay}s...")
-            time.sleep(delay)
-            
-        except Exception as e:
-            logger.error(f"❌ Batch {batch_num} failed: {e}")
-            continue
     
     # Final summary
     logger.info(f"🏁 Collection complete!")
@@ -13,14 +13,23 @@ __description__ = "Multi-Source Data Collection System"
 from src.utils.config import load_config
 from src.utils.logger import setup_logger
 
-# Make commonly used classes available at package level
-try:
-    from src.scrapers.manager import ScrapingManager
-    from src.data.database import DatabaseManager
-    from src.analysis.reports import ReportGenerator
-except ImportError:
-    # Handle case where dependencies aren't installed yet
-    pass
+# Commonly used classes are resolved on first access, so importing any
+# src.* module does not pull in the scraper, database and analysis stacks
+_LAZY_ATTRIBUTES = {
+    'ScrapingManager': 'src.scrapers.manager',
+    'DatabaseManager': 'src.data.database',
+    'ReportGenerator': 'src.analysis.reports',
+}
+
+def __getattr__(name):
+    module_path = _LAZY_ATTRIBUTES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    import importlib
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     'ScrapingManager',
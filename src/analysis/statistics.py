@@ -14,10 +14,40 @@ import logging
 from datetime import datetime, timedelta
 import sqlite3
 
+# orjson serializes numpy values and datetimes natively; fall back to the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Products with a usable price, newest first
+PRODUCTS_QUERY = """
+SELECT 
+    source,
+    title,
+    price,
+    rating,
+    search_keyword,
+    scraper_type,
+    scraped_at,
+    url,
+    image_url,
+    product_id,
+    brand,
+    condition,
+    availability,
+    review_count,
+    shipping_cost
+FROM products 
+WHERE price IS NOT NULL AND price > 0
+ORDER BY scraped_at DESC
+"""
+
 class DataStatistics:
     """
     📊 Comprehensive statistical analysis for scraped product data.
@@ -65,43 +95,57 @@ class DataStatistics:
         """Load product data from SQLite database."""
         try:
             conn = sqlite3.connect(self.db_path)
-            
-            query = """
-            SELECT 
-                source,
-                title,
-                price,
-                rating,
-                search_keyword,
-                scraper_type,
-                scraped_at,
-                url,
-                image_url,
-                product_id,
-                brand,
-                condition,
-                availability,
-                review_count,
-                shipping_cost
-            FROM products 
-            WHERE price IS NOT NULL AND price > 0
-            ORDER BY scraped_at DESC
-            """
-            
-            df = pd.read_sql_query(query, conn)
+            df = pd.read_sql_query(PRODUCTS_QUERY, conn)
             conn.close()
             
-            # Convert datetime
-            df['scraped_at'] = pd.to_datetime(df['scraped_at'])
-            # Also create created_at alias for compatibility
-            df['created_at'] = df['scraped_at']
-            
-            return df
+            return self._prepare_frame(df)
             
         except Exception as e:
             logger.error(f"Database loading error: {e}")
             return pd.DataFrame()
     
+    @staticmethod
+    def _prepare_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """Parse timestamps and add the created_at compatibility alias."""
+        # Convert datetime
+        df['scraped_at'] = pd.to_datetime(df['scraped_at'])
+        # Also create created_at alias for compatibility
+        df['created_at'] = df['scraped_at']
+        return df
+    
+    def summary_stats(self) -> Dict[str, Any]:
+        """
+        Compute headline figures with one aggregate query instead of loading rows.
+        
+        Returns:
+            Dictionary with total_products, source_count, avg_price,
+            first_scraped and last_scraped over the rows load_data() returns
+        """
+        summary = {'total_products': 0, 'source_count': 0, 'avg_price': None,
+                   'first_scraped': None, 'last_scraped': None}
+        
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                row = conn.execute("""
+                    SELECT COUNT(*), COUNT(DISTINCT source), AVG(price),
+                           MIN(scraped_at), MAX(scraped_at)
+                    FROM products
+                    WHERE price IS NOT NULL AND price > 0
+                """).fetchone()
+            finally:
+                conn.close()
+            
+            summary.update(zip(summary, row))
+            for key in ('first_scraped', 'last_scraped'):
+                if summary[key] is not None:
+                    summary[key] = pd.to_datetime(summary[key])
+            
+        except Exception as e:
+            logger.error(f"Summary query error: {e}")
+        
+        return summary
+    
     def _load_from_files(self) -> pd.DataFrame:
         """Load data from JSON files in data_output directory."""
         data_frames = []
@@ -477,12 +521,34 @@ class DataStatistics:
                 }
             }
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
+            with open(output_file, 'wb') as f:
+                f.write(self._dump_json(export_data))
             
             logger.info(f"📊 Statistics exported to {output_path}")
             return str(output_path)
             
         except Exception as e:
             logger.error(f"Failed to export statistics: {e}")
-            return "" 
\ No newline at end of file
+            return ""
+    
+    @staticmethod
+    def _dump_json(data: Dict[str, Any]) -> bytes:
+        """Serialize statistics to indented UTF-8 JSON, preferring orjson."""
+        data = _stringify_keys(data)
+        
+        if ORJSON_AVAILABLE:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            return orjson.dumps(data, option=options, default=str)
+        
+        return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+def _stringify_keys(obj: Any) -> Any:
+    """Recursively convert dict keys JSON cannot represent (tuples, dates) to strings."""
+    if isinstance(obj, dict):
+        return {
+            key if isinstance(key, (str, int, float, bool)) or key is None else str(key): _stringify_keys(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, list):
+        return [_stringify_keys(item) for item in obj]
+    return obj
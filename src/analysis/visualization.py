@@ -5,6 +5,10 @@ Simple and effective data visualization using matplotlib and seaborn for the Mul
 Creates basic charts and graphs for scraped product data analysis.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
@@ -23,6 +27,23 @@ logger = get_logger(__name__)
 plt.style.use('default')
 sns.set_palette("husl")
 
+def _init_chart_worker() -> None:
+    """Use the non-interactive Agg backend in chart worker processes."""
+    matplotlib.use('Agg')
+
+def _render_chart(name: str, df: pd.DataFrame) -> str:
+    """
+    Render one chart in a worker process.
+    
+    Args:
+        name: Chart name, matching a ``_create_<name>`` method
+        df: Columns needed by that chart
+        
+    Returns:
+        Path to the saved chart, or an empty string on failure
+    """
+    return getattr(DataVisualizer(df), f'_create_{name}')()
+
 class DataVisualizer:
     """
     📈 Simple data visualization for scraped product data.
@@ -37,6 +58,7 @@ class DataVisualizer:
     def __init__(self, df: pd.DataFrame):
         """Initialize visualizer with DataFrame."""
         self.df = df
+        self._charts = None
         
         # Create output directories
         self.output_dir = Path("data_output/reports/charts")
@@ -45,32 +67,57 @@ class DataVisualizer:
     def create_all_charts(self) -> Dict[str, str]:
         """
         Create all basic charts for the report.
+        
+        Each chart is rendered in its own worker process, and charts are
+        rendered once per visualizer; later calls return the same paths.
             
         Returns:
             Dictionary mapping chart names to file paths
         """
-        charts = {}
+        if self._charts is not None:
+            return self._charts
+        
+        # Columns each chart reads, so workers only receive what they need
+        chart_columns = {}
+        
+        # Price analysis
+        if 'price' in self.df.columns:
+            chart_columns['price_distribution'] = ['price']
+            chart_columns['price_by_source'] = ['price', 'source']
+        
+        # Source analysis
+        if 'source' in self.df.columns:
+            chart_columns['source_comparison'] = ['source', 'price', 'title']
+        
+        # Time trends
+        if 'created_at' in self.df.columns or 'scraped_at' in self.df.columns:
+            chart_columns['collection_trends'] = ['created_at' if 'created_at' in self.df.columns else 'scraped_at']
+        
+        if not chart_columns:
+            self._charts = {}
+            return self._charts
         
         try:
-            # Price analysis
-            if 'price' in self.df.columns:
-                charts['price_distribution'] = self._create_price_distribution()
-                charts['price_by_source'] = self._create_price_by_source()
-            
-            # Source analysis
-            if 'source' in self.df.columns:
-                charts['source_comparison'] = self._create_source_comparison()
-            
-            # Time trends
-            if 'created_at' in self.df.columns or 'scraped_at' in self.df.columns:
-                charts['collection_trends'] = self._create_collection_trends()
-            
-            logger.info(f"📈 Created {len(charts)} charts")
-            return charts
-                
+            # Figure rendering is CPU-bound, so each chart gets its own process
+            workers = min(len(chart_columns), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_chart_worker) as pool:
+                futures = {
+                    name: pool.submit(_render_chart, name,
+                                      self.df[[col for col in columns if col in self.df.columns]])
+                    for name, columns in chart_columns.items()
+                }
+                charts = {name: future.result() for name, future in futures.items()}
         except Exception as e:
-            logger.error(f"Chart creation failed: {e}")
-            return {}
+            logger.warning(f"Parallel chart rendering unavailable ({e}), rendering serially")
+            try:
+                charts = {name: getattr(self, f'_create_{name}')() for name in chart_columns}
+            except Exception as e:
+                logger.error(f"Chart creation failed: {e}")
+                return {}
+        
+        logger.info(f"📈 Created {len(charts)} charts")
+        self._charts = charts
+        return charts
     
     def _create_price_distribution(self) -> str:
         """Create price distribution chart."""
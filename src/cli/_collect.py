@@ -0,0 +1,58 @@
+"""
+Implementation of the collect command.
+
+Kept apart from the Click command so option parsing never pulls in the
+heavy scraping, database or analysis modules.
+"""
+
+import click
+
+from src.utils.data_collection_strategy import DataCollectionStrategy
+
+from .context import get_cli_logger
+
+def run(config, target, strategy, http_adapter=None):
+    """
+    Run the collect command with already-parsed options.
+    
+    Returns:
+        Collection results, including the final count and report path
+    """
+    get_cli_logger().info(f"[TARGET] Starting strategic collection (target: {target} records)")
+    
+    try:
+        # Initialize strategic collector
+        collector = DataCollectionStrategy(config, http_adapter=http_adapter)
+        
+        # Execute collection based on strategy
+        if strategy == 'comprehensive':
+            click.echo("[STRATEGY] Using comprehensive collection strategy...")
+            results = collector.execute_comprehensive_collection()
+        elif strategy == 'quick':
+            from src.utils.optimized_collection import OptimizedCollectionStrategy
+            opt_collector = OptimizedCollectionStrategy(config, http_adapter=http_adapter)
+            click.echo("[STRATEGY] Using quick collection strategy...")
+            results = opt_collector.execute_optimized_collection(target)
+        else:  # focused
+            click.echo("[STRATEGY] Using focused collection strategy...")
+            results = collector.execute_comprehensive_collection()
+        
+        # Both strategies count the table as they finish; only query again
+        # if that count is missing
+        final_count = results.get('total_records')
+        if not final_count:
+            from src.data.database import DatabaseManager
+            final_count = DatabaseManager().count_products()
+        
+        # Generate collection report
+        report_path = collector.generate_collection_report(results)
+        
+        click.echo(f"[SUCCESS] Collection completed!")
+        click.echo(f"[STATS] Records collected: {final_count:,}")
+        click.echo(f"[REPORT] Report saved: {report_path}")
+        
+        return {**results, 'total_records': final_count, 'report_path': report_path}
+        
+    except Exception as e:
+        get_cli_logger().error(f"Collection failed: {e}")
+        raise click.ClickException(f"Collection error: {e}")
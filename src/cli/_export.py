@@ -0,0 +1,34 @@
+"""
+Implementation of the export command.
+
+Kept apart from the Click command so option parsing never pulls in the
+heavy scraping, database or analysis modules.
+"""
+
+import click
+
+from src.data.processors import DataExporter
+
+from .context import get_cli_logger
+
+def run(config, export_format, output, filter_days):
+    """Run the export command with already-parsed options."""
+    get_cli_logger().info(f"Exporting data in {export_format} format...")
+    
+    try:
+        # Initialize exporter
+        exporter = DataExporter(config)
+        
+        # Export data
+        result = exporter.export_data(
+            format=export_format,
+            output_dir=output,
+            filter_days=filter_days
+        )
+        
+        click.echo(f"[SUCCESS] Data exported successfully!")
+        click.echo(f"[FILE] Saved to: {result}")
+        
+    except Exception as e:
+        get_cli_logger().error(f"Export failed: {e}")
+        raise click.ClickException(f"Export error: {e}")
@@ -0,0 +1,44 @@
+"""
+Implementation of the report command.
+
+Kept apart from the Click command so option parsing never pulls in the
+heavy scraping, database or analysis modules.
+"""
+
+import click
+
+from src.analysis.reports import ReportGenerator
+from src.analysis.statistics import DataStatistics
+
+from .context import get_cli_logger
+
+def run(report_type, period, output):
+    """Run the report command with already-parsed options."""
+    get_cli_logger().info(f"Generating {report_type} report...")
+    
+    try:
+        # Load data first
+        stats = DataStatistics()
+        df = stats.load_data("database")
+        
+        if df.empty:
+            click.echo("[ERROR] No data found in database. Run collection first.")
+            return
+        
+        # Initialize report generator
+        report_gen = ReportGenerator(df)
+        
+        # Generate report
+        if report_type == 'trend':
+            result = report_gen.generate_trend_report()
+        elif report_type == 'comparison':
+            result = report_gen.generate_comparison_report()
+        else:
+            result = report_gen.generate_summary_report()
+        
+        click.echo(f"[SUCCESS] {report_type.capitalize()} report generated!")
+        click.echo(f"[FILE] Report saved to: {result}")
+        
+    except Exception as e:
+        get_cli_logger().error(f"Report generation failed: {e}")
+        raise click.ClickException(f"Report error: {e}")
@@ -0,0 +1,253 @@
+"""
+Implementation of the scrape command.
+
+Kept apart from the Click command so option parsing never pulls in the
+heavy scraping, database or analysis modules.
+"""
+
+import os
+import sys
+import threading
+
+import click
+
+from src.scrapers.manager import ScrapingManager
+
+from .context import get_cli_logger
+
+# Settings for the shared Scrapy crawler runner; AutoThrottle adapts the
+# per-domain delay to server latency instead of a fixed DOWNLOAD_DELAY
+SCRAPY_SETTINGS = {
+    'USER_AGENT': 'Mozilla/5.0 (compatible; ProductScraper/1.0)',
+    'ROBOTSTXT_OBEY': True,
+    'CONCURRENT_REQUESTS': 64,
+    'CONCURRENT_REQUESTS_PER_DOMAIN': 16,
+    'REACTOR_THREADPOOL_MAXSIZE': 20,
+    'AUTOTHROTTLE_ENABLED': True,
+    'AUTOTHROTTLE_START_DELAY': 0.5,
+    'AUTOTHROTTLE_MAX_DELAY': 10,
+    'AUTOTHROTTLE_TARGET_CONCURRENCY': 8.0,
+}
+
+# Reactor installed for Scrapy unless the process already has one
+_SCRAPY_REACTOR = 'twisted.internet.asyncioreactor.AsyncioSelectorReactor'
+
+# Crawler runner, built on first scrapy run and reused afterwards
+_crawler_runner = None
+_crawler_lock = threading.Lock()
+
+# Concurrent runs with at most this many pages are fetched one by one, since
+# starting the event loop and parse pool would cost more than it saves
+_SERIAL_TASK_LIMIT = 4
+
+def run(config, sources, keywords, max_pages, scraper_type, concurrent, output, http_adapter=None,
+        resume=False, jobs=None):
+    """
+    Run the scrape command with already-parsed options (sources/keywords are lists).
+    
+    Returns:
+        Result summary for --json output
+    """
+    get_cli_logger().info("Starting scraping operation...")
+    
+    try:
+        source_list = list(sources)
+        keyword_list = list(keywords)
+        
+        # --jobs overrides the configured worker counts for this run only
+        if jobs:
+            scraping = {**config.get('scraping', {}), 'max_concurrency': jobs, 'max_workers': jobs}
+            config = {**config, 'scraping': scraping}
+        
+        # --concurrent forces the event-loop path for any scraper type
+        runner = _run_concurrent if concurrent else _SCRAPER_RUNNERS.get(scraper_type, _run_manager)
+        results = runner(config, source_list, keyword_list, max_pages, scraper_type, output,
+                         http_adapter, resume)
+        
+        click.echo(f"[SUCCESS] Scraping completed! Found {len(results)} products.")
+        click.echo(f"[DATA] Saved to: {output}")
+        
+        return {
+            'scraper_type': scraper_type,
+            'sources': source_list,
+            'keywords': keyword_list,
+            'products_found': len(results),
+            'output': output
+        }
+        
+    except Exception as e:
+        get_cli_logger().error(f"Scraping failed: {e}")
+        raise click.ClickException(f"Scraping error: {e}")
+
+def _run_concurrent(config, source_list, keyword_list, max_pages, scraper_type, output,
+                    http_adapter, resume):
+    """Fetch every static page on one event loop (thread pool without aiohttp)."""
+    from src.utils.async_manager import AIOHTTP_AVAILABLE
+    
+    jobs = [(source, keyword, page)
+            for source in source_list
+            for keyword in keyword_list
+            for page in range(1, max_pages + 1)]
+    
+    if len(jobs) <= _SERIAL_TASK_LIMIT and not resume:
+        return _scrape_serially(config, http_adapter, jobs)
+    
+    if not AIOHTTP_AVAILABLE:
+        return _scrape_with_threads(config, http_adapter, source_list, keyword_list, max_pages)
+    
+    from src.utils.async_manager import create_parse_pool, fetch_all, make_static_page_worker, run_async
+    
+    scrape_config = config.get('scraping', {})
+    parse_pool = create_parse_pool(config, scrape_config.get('parse_processes'))
+    worker = make_static_page_worker(config,
+                                     timeout=scrape_config.get('timeout', 30),
+                                     max_retries=scrape_config.get('max_retries', 3),
+                                     parse_pool=parse_pool)
+    
+    # Skip pages completed by earlier runs into this output directory
+    ledger = None
+    if resume:
+        from src.utils.task_ledger import TaskLedger
+        
+        ledger = TaskLedger(os.path.join(output, '.ledger.db'))
+        jobs = ledger.filter_new(jobs)
+        worker = ledger.track(worker)
+    
+    try:
+        return run_async(fetch_all(
+            jobs,
+            worker,
+            max_concurrency=scrape_config.get('max_concurrency', 64),
+            per_host=scrape_config.get('per_host_connections', 8)
+        ))
+    finally:
+        if ledger:
+            ledger.flush()
+        if parse_pool:
+            parse_pool.shutdown()
+
+def _run_scrapy(config, source_list, keyword_list, max_pages, scraper_type, output,
+                http_adapter, resume):
+    """Crawl every source/keyword pair with one Scrapy spider and collect its items."""
+    click.echo("Using Scrapy framework...")
+    from scrapy import signals
+    from src.scrapers.scrapy_spider import ProductSpider
+    
+    runner = _get_crawler_runner()
+    from twisted.internet import reactor, threads
+    
+    results = []
+    
+    def start_crawl():
+        # Collect items as the crawler emits them
+        crawler = runner.create_crawler(ProductSpider)
+        crawler.signals.connect(lambda item, response, spider: results.append(dict(item)),
+                                signal=signals.item_scraped, weak=False)
+        
+        # Run one spider over every source/keyword pair so Scrapy's
+        # scheduler fetches them concurrently
+        return runner.crawl(crawler,
+                            jobs=[(source, keyword) for source in source_list for keyword in keyword_list],
+                            max_pages=max_pages)
+    
+    # Schedule the crawl on the reactor thread and wait for it to finish
+    threads.blockingCallFromThread(reactor, start_crawl)
+    return results
+
+def _run_manager(config, source_list, keyword_list, max_pages, scraper_type, output,
+                 http_adapter, resume):
+    """Scrape through ScrapingManager with the given scraper type (static/selenium)."""
+    manager = ScrapingManager(config, http_adapter=http_adapter)
+    return manager.scrape_all(
+        sources=source_list,
+        keywords=keyword_list,
+        max_pages=max_pages,
+        output_dir=output,
+        scraper_type=scraper_type
+    )
+
+# Scraper type -> runner; anything else goes through ScrapingManager
+_SCRAPER_RUNNERS = {
+    'concurrent': _run_concurrent,
+    'async': _run_concurrent,
+    'scrapy': _run_scrapy,
+}
+
+def _create_static_scrapers(config, http_adapter, source_list):
+    """Create one StaticScraper per source, attached to the shared HTTP pool if any."""
+    from src.scrapers.static_scraper import StaticScraper
+    
+    scrapers = {source: StaticScraper(source, config) for source in source_list}
+    if http_adapter is not None:
+        for scraper in scrapers.values():
+            scraper.use_http_adapter(http_adapter)
+    return scrapers
+
+def _scrape_serially(config, http_adapter, jobs):
+    """Scrape a handful of (source, keyword, page) jobs one after another."""
+    scrapers = _create_static_scrapers(config, http_adapter, {source for source, _, _ in jobs})
+    results = []
+    try:
+        for source, keyword, page in jobs:
+            try:
+                results.extend(scrapers[source].scrape_page(keyword, page))
+            except Exception as e:
+                get_cli_logger().error(f"Failed to scrape {source} page {page} for '{keyword}': {e}")
+    finally:
+        for scraper in scrapers.values():
+            scraper.close()
+    return results
+
+def _scrape_with_threads(config, http_adapter, source_list, keyword_list, max_pages):
+    """Fallback thread-pool scrape used when aiohttp is not installed."""
+    from src.utils.concurrent_manager import ConcurrentScrapingManager
+    
+    # One lightweight scraper per source instead of a full ScrapingManager
+    scrapers = _create_static_scrapers(config, http_adapter, source_list)
+    
+    concurrent_manager = ConcurrentScrapingManager(config)
+    concurrent_manager.add_scraping_tasks(
+        sources=source_list,
+        keywords=keyword_list,
+        max_pages=max_pages,
+        scraper_type='static'
+    )
+    
+    # Define worker function
+    def scrape_worker(source, keyword, page, scraper_type):
+        return scrapers[source].scrape_page(keyword, page)
+    
+    try:
+        return concurrent_manager.execute_concurrent_scraping(scrape_worker)
+    finally:
+        for scraper in scrapers.values():
+            scraper.close()
+
+def _get_crawler_runner():
+    """Build the shared CrawlerRunner and start its reactor thread on first use."""
+    global _crawler_runner
+    with _crawler_lock:
+        if _crawler_runner is None:
+            from scrapy.crawler import CrawlerRunner
+            from scrapy.utils.log import configure_logging
+            from scrapy.utils.reactor import install_reactor
+            
+            settings = dict(SCRAPY_SETTINGS)
+            if 'twisted.internet.reactor' in sys.modules:
+                # Keep whichever reactor the process already installed
+                settings['TWISTED_REACTOR'] = None
+            else:
+                install_reactor(_SCRAPY_REACTOR)
+                settings['TWISTED_REACTOR'] = _SCRAPY_REACTOR
+            from twisted.internet import reactor
+            
+            configure_logging(settings)
+            _crawler_runner = CrawlerRunner(settings)
+            
+            # A reactor cannot be restarted once stopped, so it runs on a
+            # daemon thread for the rest of the process and every scrapy run
+            # (including repeated ones from the daemon) schedules onto it
+            if not reactor.running:
+                threading.Thread(target=reactor.run, kwargs={'installSignalHandlers': False},
+                                 name='scrapy-reactor', daemon=True).start()
+    return _crawler_runner
@@ -0,0 +1,97 @@
+"""
+Collection commands: collect and turbo.
+"""
+
+import copy
+
+import click
+
+from .context import (echo_json, get_cached_manager, get_cli_logger, get_ctx_config, get_http_adapter, json_option,
+                      machine_output, target_option)
+
+# Strategies accepted by the collect command
+_COLLECT_STRATEGIES = click.Choice(('comprehensive', 'quick', 'focused'))
+
+# turbo summary, formatted once per run and printed as one block
+_TURBO_SUMMARY = (
+    "[TURBO] Collection Complete!\n"
+    "[BATCH] Batches processed: {batches_processed}\n"
+    "[WORKERS] Parallel workers: {workers}\n"
+    "[RECORDS] Final count: {total_records:,} records\n"
+    "[TIME] Total time: {total_time:.1f} seconds\n"
+    "[SPEED] Performance: {records_per_second:.1f} records/second\n"
+    "[SUCCESS] Success rate: {success_rate:.1f}%"
+)
+
+@click.command()
+@target_option
+@click.option('--strategy', 
+              type=_COLLECT_STRATEGIES,
+              default='comprehensive', help='Collection strategy')
+@json_option
+@click.pass_context
+def collect(ctx, target, strategy, as_json):
+    """Advanced data collection with strategic approach."""
+    from ._collect import run
+    
+    with machine_output(as_json):
+        results = run(get_ctx_config(ctx), target, strategy, http_adapter=get_http_adapter(ctx))
+    if as_json:
+        echo_json(results)
+
+@click.command()
+@target_option
+@click.option('--workers', default=8, help='Number of parallel workers')
+@click.option('--batch-size', default=12, help='Batch size for parallel processing')
+@json_option
+@click.pass_context
+def turbo(ctx, target, workers, batch_size, as_json):
+    """[TURBO MODE] High-speed optimized data collection (5-10x faster)."""
+    with machine_output(as_json):
+        results = _run_turbo(ctx, target, workers, batch_size)
+    if as_json:
+        echo_json(results)
+
+def _run_turbo(ctx, target, workers, batch_size):
+    """Run turbo mode with already-parsed options and return the collection results."""
+    from src.utils.optimized_collection import OptimizedCollectionStrategy
+    
+    get_cli_logger().info(f"[TURBO] Starting mode: Collecting {target:,} records with {workers} workers")
+    
+    try:
+        # Update config with worker settings
+        config = copy.deepcopy(get_ctx_config(ctx))
+        config.setdefault('collection', {})
+        config['collection']['max_workers'] = workers
+        config['collection']['batch_size'] = batch_size
+        
+        # Initialize optimized collector, reused across daemon requests
+        http_adapter = get_http_adapter(ctx)
+        collector = get_cached_manager(
+            ctx, ('turbo', workers, batch_size),
+            lambda keep_warm: OptimizedCollectionStrategy(config, http_adapter=http_adapter)
+        )
+        
+        # Execute turbo collection
+        results = collector.execute_optimized_collection(target)
+        
+        # Display comprehensive results
+        click.echo(_TURBO_SUMMARY.format(
+            batches_processed=results.get('batches_processed', 0),
+            workers=workers,
+            total_records=results['total_records'],
+            total_time=results['total_time'],
+            records_per_second=results['records_per_second'],
+            success_rate=results.get('success_rate', 0)
+        ))
+        
+        if results.get('target_achieved', False):
+            click.echo(f"[TARGET] TARGET ACHIEVED! {results['total_records']:,} >= {target:,}")
+        else:
+            click.echo(f"[TARGET] Partial completion: {results['total_records']:,}/{target:,}")
+        
+        return results
+        
+    except Exception as e:
+        get_cli_logger().error(f"Turbo mode failed: {e}")
+        raise click.ClickException(f"Turbo mode error: {e}")
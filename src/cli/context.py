@@ -0,0 +1,135 @@
+"""
+Shared helpers for CLI commands.
+
+Provides the lazily created CLI logger, the per-invocation
+configuration loader, HTTP connection pool and manager cache, option
+parsing, common option decorators and the --json machine-output helpers
+shared by the command modules.
+"""
+
+import contextlib
+import json
+import logging
+import re
+import sys
+
+import click
+
+# CLI logger, created on first use so --help stays cheap
+_logger = None
+
+# Comma separator with any surrounding whitespace
+_CSV_SPLIT = re.compile(r'\s*,\s*')
+
+# Options repeated verbatim across commands, declared once and shared
+target_option = click.option('--target', default=5000, help='Target number of records to collect')
+json_option = click.option('--json', 'as_json', is_flag=True, help='Print the results as JSON on stdout')
+
+def get_cli_logger() -> logging.Logger:
+    """Return the CLI logger, setting it up on first call."""
+    global _logger
+    if _logger is None:
+        from src.utils.logger import setup_logger
+        _logger = setup_logger('main')
+    return _logger
+
+def get_ctx_config(ctx) -> dict:
+    """Load the configuration on first use and memoize it on the context."""
+    obj = ctx.find_root().obj
+    
+    if 'config' not in obj:
+        from src.utils.config import load_config
+        
+        config_path = obj['config_path']
+        try:
+            obj['config'] = load_config(config_path)
+            get_cli_logger().info(f"Configuration loaded from {config_path}")
+        except Exception as e:
+            get_cli_logger().error(f"Failed to load configuration: {e}")
+            raise click.ClickException(f"Configuration error: {e}")
+    
+    return obj['config']
+
+def get_http_adapter(ctx):
+    """
+    Return the invocation's shared HTTP connection pool, creating it on first use.
+    
+    The adapter is closed when the root context closes.
+    """
+    root = ctx.find_root()
+    obj = root.obj
+    
+    if 'http_adapter' not in obj:
+        from src.utils.helpers import create_http_adapter
+        
+        adapter = obj['http_adapter'] = create_http_adapter()
+        root.call_on_close(adapter.close)
+    
+    return obj['http_adapter']
+
+def get_cached_manager(ctx, key, factory):
+    """
+    Return a long-lived manager object for key, building it with factory on first use.
+    
+    Under the daemon the manager is cached in ctx.obj['managers'] and
+    reused by later requests; otherwise it is built for this invocation
+    and shut down when the root context closes. factory is called with
+    keep_warm=True when the manager will outlive the invocation.
+    """
+    root = ctx.find_root()
+    managers = root.obj.get('managers')
+    
+    if managers is None:
+        manager = factory(keep_warm=False)
+        if hasattr(manager, 'shutdown'):
+            root.call_on_close(manager.shutdown)
+        return manager
+    
+    if key not in managers:
+        managers[key] = factory(keep_warm=True)
+    return managers[key]
+
+@contextlib.contextmanager
+def machine_output(as_json: bool):
+    """
+    Keep stdout clean for a --json result while the command runs.
+    
+    Progress echoes go to stderr and log records are suppressed, so the
+    only thing written to stdout is the JSON emitted by echo_json().
+    """
+    if not as_json:
+        yield
+        return
+    
+    logging.disable(logging.CRITICAL)
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+def echo_json(data) -> None:
+    """Write a command result to stdout as one line of JSON."""
+    try:
+        import orjson
+        text = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    except ImportError:
+        text = json.dumps(data, default=str, separators=(',', ':'))
+    click.echo(text)
+
+def split_csv(value: str) -> list:
+    """Split a comma-separated option value, dropping whitespace, empty and repeated items."""
+    return list(dict.fromkeys(item for item in _CSV_SPLIT.split(value.strip()) if item))
+
+class CsvList(click.ParamType):
+    """Click parameter type that converts 'a, b,c' into ['a', 'b', 'c'] during parsing."""
+    
+    name = 'list'
+    
+    def convert(self, value, param, ctx):
+        if isinstance(value, (list, tuple)):
+            return list(value)
+        return split_csv(value)
+
+# Shared instance for comma-separated options
+CSV_LIST = CsvList()
@@ -0,0 +1,154 @@
+"""
+Daemon command: keep one warm process serving CLI requests.
+
+Repeated invocations sent with ``main.py --via-daemon ...`` run inside
+this process, so imports, the parsed configuration, the database engine
+and the HTTP connection pool are set up once instead of per call. The
+``hyper`` and ``turbo`` managers are cached per command and options, so
+repeat calls skip the browser warm-up; cached managers keep the
+configuration they were built with until the daemon restarts.
+
+Protocol: the client sends one JSON line ``{"argv": [...]}``; the daemon
+streams ``{"out": "..."}`` lines while the command runs and finishes with
+``{"exit": code}``.
+"""
+
+import asyncio
+import io
+import json
+import os
+import socket
+from contextlib import redirect_stderr, redirect_stdout
+
+import click
+
+from .context import get_cli_logger
+
+# Default socket path shared by the daemon and --via-daemon clients
+DEFAULT_SOCKET = os.path.expanduser('~/.dcs.sock')
+
+class _StreamToClient(io.TextIOBase):
+    """Text stream that forwards writes from the command thread to the client."""
+    
+    def __init__(self, loop, writer):
+        self._loop = loop
+        self._writer = writer
+    
+    def writable(self):
+        return True
+    
+    def write(self, text):
+        if isinstance(text, (bytes, bytearray)):
+            text = text.decode('utf-8', 'replace')
+        if text:
+            line = json.dumps({'out': text}) + '\n'
+            self._loop.call_soon_threadsafe(self._writer.write, line.encode())
+        return len(text)
+
+def _run_command(argv, stream, http_adapter, managers):
+    """Run one CLI invocation in-process with its output sent to stream; return the exit code."""
+    from main import main
+    
+    with redirect_stdout(stream), redirect_stderr(stream):
+        try:
+            main.main(args=argv, prog_name='main.py', standalone_mode=False,
+                      obj={'http_adapter': http_adapter, 'managers': managers})
+            return 0
+        except click.exceptions.Exit as e:
+            return e.exit_code
+        except click.ClickException as e:
+            e.show()
+            return e.exit_code
+        except click.Abort:
+            click.echo("Aborted!", err=True)
+            return 1
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        except Exception as e:
+            get_cli_logger().error(f"Daemon request failed: {e}")
+            click.echo(f"Error: {e}", err=True)
+            return 1
+
+async def _serve(socket_path):
+    """Accept requests on a Unix socket and run them one at a time."""
+    from src.utils.helpers import create_http_adapter
+    
+    http_adapter = create_http_adapter()
+    managers = {}
+    lock = asyncio.Lock()
+    loop = asyncio.get_running_loop()
+    
+    async def handle(reader, writer):
+        try:
+            request = json.loads(await reader.readline())
+            argv = [str(arg) for arg in request.get('argv', [])]
+            
+            # Commands share process-wide state (stdout, signal handlers), so
+            # requests are serialized
+            async with lock:
+                get_cli_logger().info(f"Daemon running: {' '.join(argv)}")
+                stream = _StreamToClient(loop, writer)
+                code = await asyncio.to_thread(_run_command, argv, stream, http_adapter, managers)
+            
+            writer.write((json.dumps({'exit': code}) + '\n').encode())
+            await writer.drain()
+        except Exception as e:
+            get_cli_logger().error(f"Daemon connection error: {e}")
+        finally:
+            writer.close()
+    
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    
+    server = await asyncio.start_unix_server(handle, path=socket_path)
+    click.echo(f"[DAEMON] Listening on {socket_path}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        for manager in managers.values():
+            if hasattr(manager, 'shutdown'):
+                manager.shutdown()
+        http_adapter.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+def send_request(argv, socket_path=DEFAULT_SOCKET):
+    """
+    Run a CLI invocation on a running daemon, echoing its output as it arrives.
+    
+    Args:
+        argv: Command-line arguments, without the program name
+        socket_path: Daemon socket path
+    
+    Returns:
+        The command's exit code
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError as e:
+            raise click.ClickException(f"No daemon listening on {socket_path} ({e}); start one with 'main.py daemon'")
+        
+        sock.sendall((json.dumps({'argv': argv}) + '\n').encode())
+        
+        with sock.makefile('r', encoding='utf-8') as responses:
+            for line in responses:
+                message = json.loads(line)
+                if 'exit' in message:
+                    return message['exit']
+                click.echo(message['out'], nl=False)
+    
+    raise click.ClickException("Daemon closed the connection before the command finished")
+
+@click.command()
+@click.option('--socket', 'socket_path', default=DEFAULT_SOCKET, help='Unix socket to listen on')
+def daemon(socket_path):
+    """Serve CLI commands from one warm process (use with main.py --via-daemon)."""
+    if not hasattr(socket, 'AF_UNIX'):
+        raise click.ClickException("The daemon needs Unix domain sockets, which this platform lacks")
+    
+    try:
+        asyncio.run(_serve(socket_path))
+    except KeyboardInterrupt:
+        click.echo("[DAEMON] Stopped")
@@ -0,0 +1,22 @@
+"""
+Data export command.
+"""
+
+import click
+
+from .context import get_ctx_config
+
+# Export formats accepted by the export command
+_EXPORT_FORMATS = click.Choice(('parquet', 'feather', 'csv', 'json', 'excel'))
+
+@click.command()
+@click.option('--format', 'export_format',
+              type=_EXPORT_FORMATS,
+              default='csv', help='Export format')
+@click.option('--output', default='data_output/processed', help='Output directory')
+@click.option('--filter-days', default=7, help='Filter data from last N days')
+@click.pass_context
+def export(ctx, export_format, output, filter_days):
+    """Export processed data in various formats."""
+    from ._export import run
+    return run(get_ctx_config(ctx), export_format, output, filter_days)
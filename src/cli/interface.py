@@ -1,13 +1,13 @@
 """
 CLI Interface Module
 
-This module is currently a placeholder since the main CLI functionality
-is implemented directly in main.py. This import is for future extensibility.
+This module is currently a placeholder. The CLI group lives in main.py and
+its commands are implemented in the sibling modules of this package.
 """
 
 import click
 
-# This is a placeholder - the actual CLI is in main.py
+# This is a placeholder - the actual CLI is main.py plus src/cli commands
 cli = click.Group()
 
 @cli.command()
@@ -0,0 +1,191 @@
+"""
+Reporting commands: report and generate-report.
+"""
+
+import importlib.util
+
+import click
+
+from .context import get_cli_logger
+
+# Option choices, built once at import
+_REPORT_TYPES = click.Choice(('trend', 'comparison', 'summary'))
+_REPORT_FORMATS = click.Choice(('html', 'json', 'csv', 'all'))
+
+@click.command()
+@click.option('--type', 'report_type', 
+              type=_REPORT_TYPES,
+              default='summary', help='Report type')
+@click.option('--period', default=30, help='Analysis period in days')
+@click.option('--output', default='data_output/reports', help='Output directory')
+@click.pass_context
+def report(ctx, report_type, period, output):
+    """Generate analysis reports."""
+    from ._report import run
+    return run(report_type, period, output)
+
+@click.command()
+@click.option('--format', default='html', type=_REPORT_FORMATS, 
+              help='Output format for the report')
+@click.option('--output-dir', default='data_output/reports', help='Output directory for reports')
+@click.option('--include-charts/--no-include-charts', default=True, help='Include visualizations in report')
+def generate_report(format, output_dir, include_charts):
+    """Generate comprehensive analysis reports with statistics and visualizations."""
+    click.echo("[REPORT] Generating Comprehensive Analysis Report...")
+    
+    try:
+        from src.analysis.statistics import DataStatistics
+        
+        # Initialize analysis components
+        stats = DataStatistics()
+        
+        # Headline figures come from one aggregate query
+        summary = stats.summary_stats()
+        if not summary['total_products']:
+            click.echo("[ERROR] No data found in database. Run collection first.")
+            return
+        
+        # Product rows are loaded on first use, and only by the branches that
+        # need them; stats keeps the frame on stats.df afterwards
+        def load_frame():
+            if stats.df is not None:
+                return stats.df
+            click.echo("[DATA] Loading data for analysis...")
+            df = stats.load_data("database")
+            click.echo(f"[SUCCESS] Loaded {len(df)} records for analysis")
+            return df
+        
+        # Charts rendered for the HTML report are reused for --include-charts
+        visualizer = None
+        
+        # Generate reports based on format
+        if format == 'html' or format == 'all':
+            # Generate HTML report
+            from src.analysis.reports import ReportGenerator
+            report_gen = ReportGenerator(load_frame())
+            visualizer = report_gen.visualizer
+            html_path = report_gen.generate_comprehensive_report()
+            
+            if html_path:
+                click.echo(f"[SUCCESS] HTML report saved: {html_path}")
+            else:
+                click.echo("[ERROR] Failed to generate HTML report")
+        
+        if format == 'json' or format == 'all':
+            # Generate comprehensive statistics first
+            click.echo("[ANALYSIS] Generating comprehensive statistics...")
+            load_frame()
+            stats.generate_comprehensive_statistics()
+            
+            # Export statistics to JSON
+            json_path = stats.export_statistics()
+            if json_path:
+                click.echo(f"[SUCCESS] JSON statistics saved: {json_path}")
+        
+        if format == 'csv' or format == 'all':
+            # Export data to CSV
+            import numpy as np
+            import pandas as pd
+            from pathlib import Path
+            from datetime import datetime
+            
+            df = load_frame()
+            output_path = Path(output_dir)
+            output_path.mkdir(parents=True, exist_ok=True)
+            
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            csv_path = output_path / f"products_export_{timestamp}.csv"
+            
+            df.to_csv(csv_path, index=False)
+            click.echo(f"[SUCCESS] CSV export saved: {csv_path}")
+            
+            # Export Excel with multiple sheets
+            excel_path = output_path / f"products_analysis_{timestamp}.xlsx"
+            engine, engine_kwargs = _excel_engine()
+            with pd.ExcelWriter(excel_path, engine=engine, engine_kwargs=engine_kwargs) as writer:
+                # Main data
+                _write_sheet(writer, df, 'Products', index=False)
+                
+                # Summary by source
+                if 'source' in df.columns:
+                    source_summary = df.groupby('source', observed=True, sort=False)['price'].agg(
+                        ['count', 'mean', 'median', 'std']
+                    ).round(2)
+                    _write_sheet(writer, source_summary, 'Source_Summary')
+                
+                # Price ranges
+                if 'price' in df.columns:
+                    # Bin prices in one vectorized pass instead of four masks
+                    counts, _ = np.histogram(df['price'].dropna().to_numpy(),
+                                             bins=[-np.inf, 100, 500, 1000, np.inf])
+                    price_ranges = pd.DataFrame({
+                        'Range': ['Under $100', '$100-$500', '$500-$1000', 'Over $1000'],
+                        'Count': counts
+                    })
+                    _write_sheet(writer, price_ranges, 'Price_Analysis', index=False)
+            
+            click.echo(f"[SUCCESS] Excel analysis saved: {excel_path}")
+        
+        if include_charts:
+            # Generate visualizations
+            click.echo("[CHARTS] Creating visualizations...")
+            if visualizer is None:
+                from src.analysis.visualization import DataVisualizer
+                visualizer = DataVisualizer(load_frame())
+            charts = visualizer.create_all_charts()
+            
+            if charts:
+                chart_lines = [f"[SUCCESS] Generated {len(charts)} visualizations:"]
+                chart_lines.extend(f"   - {chart_name}: {chart_path}" for chart_name, chart_path in charts.items())
+                click.echo("\n".join(chart_lines))
+        
+        # Emit the closing summary as one block
+        summary_lines = [
+            "\n[SUMMARY] Report generation completed successfully!",
+            f"\n[STATS] Summary:",
+            f"   - Total products analyzed: {summary['total_products']:,}",
+            f"   - Data sources: {summary['source_count']}",
+            f"   - Average price: ${summary['avg_price']:.2f}" if summary['avg_price'] is not None else "",
+        ]
+        if summary['first_scraped'] is not None:
+            summary_lines.append(f"   - Date range: {summary['first_scraped']} to {summary['last_scraped']}")
+        click.echo("\n".join(summary_lines))
+        
+    except Exception as e:
+        click.echo(f"[ERROR] Report generation failed: {e}")
+        get_cli_logger().error(f"Report generation error: {e}")
+
+def _excel_engine():
+    """
+    Prefer the faster write-only xlsxwriter engine, falling back to openpyxl.
+    
+    Returns:
+        (engine name, engine_kwargs) for pd.ExcelWriter; xlsxwriter runs in
+        constant_memory mode, flushing each row to disk as the next one starts
+    """
+    if importlib.util.find_spec('xlsxwriter') is not None:
+        return 'xlsxwriter', {'options': {'constant_memory': True,
+                                          'default_date_format': 'yyyy-mm-dd hh:mm:ss'}}
+    return 'openpyxl', {}
+
+def _write_sheet(writer, frame, sheet_name, index=True):
+    """
+    Write a DataFrame to a new sheet of the workbook.
+    
+    DataFrame.to_excel emits cells column by column, which constant_memory
+    xlsxwriter cannot take (it only keeps the current row), so xlsxwriter
+    sheets are written here row by row instead.
+    """
+    if writer.engine != 'xlsxwriter':
+        frame.to_excel(writer, sheet_name=sheet_name, index=index)
+        return
+    
+    if index:
+        frame = frame.reset_index()
+    worksheet = writer.book.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, [str(column) for column in frame.columns])
+    
+    # Missing values become empty cells
+    cells = frame.astype(object).where(frame.notna(), None)
+    for row, values in enumerate(cells.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row, 0, values)
@@ -0,0 +1,252 @@
+"""
+Scraping commands: scrape, scrape-parallel and hyper.
+"""
+
+import click
+
+from .context import (CSV_LIST, echo_json, get_cached_manager, get_cli_logger, get_ctx_config, get_http_adapter,
+                      json_option, machine_output)
+
+# Scraper backends accepted by the scrape command
+_SCRAPER_CHOICES = click.Choice(('static', 'selenium', 'scrapy', 'concurrent', 'async'))
+
+# hyper summary, formatted once per run and printed as one block
+_HYPER_SUMMARY = (
+    "[HYPER] Results Summary:\n"
+    "[TARGET] Target: {status}\n"
+    "[RECORDS] Collected: {total_records:,}\n"
+    "[SUCCESS] Success rate: {success_rate}\n"
+    "[TIME] Duration: {duration:.1f} seconds"
+)
+
+@click.command()
+@click.option('--sources', type=CSV_LIST, default='amazon,ebay', help='Comma-separated list of sources')
+@click.option('--keywords', type=CSV_LIST, required=True, help='Comma-separated search keywords')
+@click.option('--max-pages', default=5, help='Maximum pages per source')
+@click.option('--scraper-type', 
+              type=_SCRAPER_CHOICES,
+              default='static', help='Type of scraper to use')
+@click.option('--concurrent', is_flag=True, help='Use concurrent processing')
+@click.option('--output', default='data_output/raw', help='Output directory')
+@click.option('--resume', is_flag=True, help='Skip pages already scraped into the output directory (concurrent/async)')
+@click.option('--jobs', type=click.IntRange(min=1), help='Parallel fetches for concurrent/async runs (default: from config)')
+@json_option
+@click.pass_context
+def scrape(ctx, sources, keywords, max_pages, scraper_type, concurrent, output, resume, jobs, as_json):
+    """Start scraping products from specified sources."""
+    from ._scrape import run
+    
+    with machine_output(as_json):
+        summary = run(get_ctx_config(ctx), sources, keywords, max_pages, scraper_type, concurrent, output,
+                      http_adapter=get_http_adapter(ctx), resume=resume, jobs=jobs)
+    if as_json:
+        echo_json(summary)
+
+@click.command()
+@click.option('--sources', type=CSV_LIST, default='ebay,walmart,amazon', help='Comma-separated sources')
+@click.option('--keywords', type=CSV_LIST, default='laptop,gaming', help='Comma-separated keywords')
+@click.option('--max-pages', default=2, help='Maximum pages per source')
+@click.option('--hybrid/--no-hybrid', default=True, help='Use both static and selenium scrapers')
+@click.option('--output-dir', default='data_output/raw', help='Output directory')
+@click.pass_context
+def scrape_parallel(ctx, sources, keywords, max_pages, hybrid, output_dir):
+    """🚀 HIGH-PERFORMANCE parallel scraping using both BeautifulSoup4 and Selenium."""
+    from src.scrapers.manager import ScrapingManager
+    
+    keyword_list = keywords
+    source_list = sources
+    
+    # Auto-disable hybrid for eBay-only scraping (eBay needs Selenium due to protection)
+    if len(source_list) == 1 and source_list[0].lower() == 'ebay' and hybrid:
+        click.echo("⚠️  [AUTO-ADJUST] eBay detected - switching to Selenium-only mode for better results")
+        hybrid = False
+    
+    click.echo(f"🚀 [TURBO] Starting HIGH-PERFORMANCE parallel scraping")
+    click.echo(f"📊 [CONFIG] Sources: {source_list}")
+    click.echo(f"🔍 [CONFIG] Keywords: {keyword_list}")
+    click.echo(f"📄 [CONFIG] Max pages per source: {max_pages}")
+    click.echo(f"⚡ [CONFIG] Hybrid mode (static + selenium): {'ENABLED' if hybrid else 'DISABLED'}")
+    
+    try:
+        manager = ScrapingManager(get_ctx_config(ctx), http_adapter=get_http_adapter(ctx))
+        
+        # Execute high-performance parallel scraping
+        results = manager.scrape_all_parallel(
+            sources=source_list,
+            keywords=keyword_list,
+            max_pages=max_pages,
+            output_dir=output_dir,
+            use_hybrid=hybrid
+        )
+        
+        click.echo(f"🎉 [SUCCESS] Parallel scraping completed!")
+        click.echo(f"📊 [RESULTS] Total products scraped: {len(results)}")
+        click.echo(f"💾 [OUTPUT] Data saved to: {output_dir}")
+        
+        if len(results) == 0:
+            click.echo("⚠️  [WARNING] No products were collected. This may be due to:")
+            click.echo("   • Anti-bot protection blocking requests")
+            click.echo("   • Invalid source/keyword combinations")
+            click.echo("   • Network connectivity issues")
+            click.echo("💡 [TIP] Try using --no-hybrid for selenium-only mode, or check logs for details")
+        
+    except Exception as e:
+        click.echo(f"❌ [ERROR] Parallel scraping failed: {e}")
+        get_cli_logger().error(f"Parallel scraping error: {e}")
+
+@click.command()
+@click.option('--target', default=2000, help='Target number of records to collect')
+@click.option('--browsers', default=4, help='Number of parallel browser instances (browser contexts with Playwright)')
+@click.option('--sources', type=CSV_LIST, default='amazon,ebay,walmart', help='Comma-separated sources')
+@click.option('--keywords', type=CSV_LIST, default='laptop,phone,tablet,headphones', help='Comma-separated keywords')
+@click.option('--max-pages', default=3, help='Maximum pages per keyword')
+@click.option('--resume', is_flag=True, help='Skip static-source pages already scraped in earlier runs')
+@json_option
+@click.pass_context
+def hyper(ctx, target, browsers, sources, keywords, max_pages, resume, as_json):
+    """[HYPER MODE] Parallel Selenium with maximum anti-bot protection (10-20x faster)."""
+    with machine_output(as_json):
+        summary = _run_hyper(ctx, target, browsers, sources, keywords, max_pages, resume)
+    if as_json:
+        echo_json(summary)
+
+def _run_hyper(ctx, target, browsers, sources, keywords, max_pages, resume):
+    """Run hyper mode with already-parsed options and return its result summary."""
+    get_cli_logger().info(f"[HYPER] Starting mode: {browsers} parallel browsers targeting {target:,} records")
+    
+    import time
+    
+    start_ns = time.perf_counter_ns()
+    try:
+        config = get_ctx_config(ctx)
+        
+        source_list = sources
+        keyword_list = keywords
+        
+        # Server-rendered sources skip the browsers and go over plain HTTP
+        static_sources, js_sources = _partition_sources(config, source_list)
+        
+        static_products = []
+        if static_sources:
+            click.echo(f"[HYPER] Static HTTP sources: {static_sources}")
+            static_products = _scrape_static_async(config, static_sources, keyword_list, max_pages, resume)
+        
+        results = {'total_products': 0, 'tasks_completed': 0, 'tasks_failed': 0}
+        js_target = max(target - len(static_products), 0)
+        
+        from src.utils.playwright_pool import PLAYWRIGHT_AVAILABLE
+        
+        if js_sources and PLAYWRIGHT_AVAILABLE:
+            # One Chromium process; --browsers caps the open contexts
+            click.echo(f"[HYPER] Browser pool sources: {js_sources}")
+            results = _scrape_browser_pool(config, js_sources, keyword_list, max_pages, js_target, browsers)
+        elif js_sources:
+            from src.utils.parallel_selenium_manager import ParallelSeleniumManager
+            
+            # Parallel manager sized to the browser-bound sources; the daemon
+            # keeps it and its browsers open between requests
+            max_browsers = min(browsers, len(js_sources) * 2)
+            manager = get_cached_manager(
+                ctx, ('hyper', max_browsers),
+                lambda keep_warm: ParallelSeleniumManager(config, max_browsers=max_browsers,
+                                                          keep_browsers=keep_warm)
+            )
+            
+            # Execute parallel scraping
+            results = manager.execute_parallel_scraping(
+                sources=js_sources,
+                keywords=keyword_list,
+                max_pages=max_pages,
+                target_products=js_target
+            )
+        
+        total_records = results['total_products'] + len(static_products)
+        tasks_completed = results['tasks_completed']
+        tasks_total = tasks_completed + results['tasks_failed']
+        success_rate = tasks_completed / tasks_total * 100 if tasks_total else None
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
+        
+        # Display results
+        click.echo(_HYPER_SUMMARY.format(
+            status='ACHIEVED' if total_records >= target else 'PARTIAL',
+            total_records=total_records,
+            success_rate=f"{success_rate:.1f}%" if success_rate is not None else "N/A",
+            duration=duration
+        ))
+        
+        return {
+            'target': target,
+            'target_achieved': total_records >= target,
+            'total_records': total_records,
+            'tasks_completed': tasks_completed,
+            'tasks_failed': results['tasks_failed'],
+            'success_rate': success_rate,
+            'duration': duration
+        }
+        
+    except Exception as e:
+        get_cli_logger().error(f"Hyper mode failed: {e}")
+        raise click.ClickException(f"Hyper mode error: {e}")
+
+def _scrape_browser_pool(config, sources, keywords, max_pages, target, n_contexts):
+    """Render browser-bound sources in a Playwright context pool and save them per source."""
+    from src.utils.async_manager import run_async
+    from src.utils.helpers import format_filename, save_json
+    from src.utils.playwright_pool import run_pool
+    
+    results = run_async(run_pool(config, sources, keywords, max_pages,
+                                 target=target, n_contexts=n_contexts))
+    
+    for source in sources:
+        source_products = [p for p in results['products'] if p.get('source') == source]
+        if source_products:
+            save_json(source_products, f"data_output/raw/{format_filename(f'{source}_browser.json')}")
+    
+    return results
+
+def _partition_sources(config, source_list):
+    """Split sources into (static HTTP, browser-rendered) lists."""
+    from src.utils.async_manager import AIOHTTP_AVAILABLE
+    
+    if not AIOHTTP_AVAILABLE:
+        return [], list(source_list)
+    
+    static_set = set(config.get('scraping', {}).get('static_sources', []))
+    static_sources = [source for source in source_list if source in static_set]
+    js_sources = [source for source in source_list if source not in static_set]
+    return static_sources, js_sources
+
+def _scrape_static_async(config, sources, keywords, max_pages, resume=False):
+    """Fetch static sources with aiohttp and save them per source to data_output/raw."""
+    from src.utils.async_manager import create_parse_pool, fetch_all, make_static_page_worker, run_async
+    from src.utils.helpers import format_filename, save_json
+    
+    jobs = [(source, keyword, page)
+            for source in sources
+            for keyword in keywords
+            for page in range(1, max_pages + 1)]
+    parse_pool = create_parse_pool(config, config.get('scraping', {}).get('parse_processes'))
+    worker = make_static_page_worker(config, parse_pool=parse_pool)
+    
+    ledger = None
+    if resume:
+        from src.utils.task_ledger import TaskLedger
+        
+        ledger = TaskLedger('data_output/raw/.ledger.db')
+        jobs = ledger.filter_new(jobs)
+        worker = ledger.track(worker)
+    
+    try:
+        products = run_async(fetch_all(jobs, worker))
+    finally:
+        if ledger:
+            ledger.flush()
+        if parse_pool:
+            parse_pool.shutdown()
+    
+    for source in sources:
+        source_products = [p for p in products if p.get('source') == source]
+        if source_products:
+            save_json(source_products, f"data_output/raw/{format_filename(f'{source}_async.json')}")
+    
+    return products
@@ -0,0 +1,29 @@
+"""
+Project setup command.
+"""
+
+import click
+
+from .context import get_cli_logger
+
+@click.command()
+@click.pass_context
+def setup(ctx):
+    """Initialize project structure and database."""
+    get_cli_logger().info("Setting up project structure...")
+    
+    try:
+        # Create directories (only the missing ones are touched)
+        from src.utils.helpers import create_directories
+        create_directories()
+        
+        click.echo("[SUCCESS] Directories created")
+        
+        # Initialize database
+        from src.data.database import DatabaseManager
+        db_manager = DatabaseManager()
+        click.echo("[SUCCESS] Database initialized")
+        
+    except Exception as e:
+        get_cli_logger().error(f"Setup failed: {e}")
+        raise click.ClickException(f"Setup error: {e}")
@@ -0,0 +1,27 @@
+"""
+Test runner command.
+"""
+
+import click
+
+@click.command()
+def test():
+    """Run comprehensive system tests."""
+    import sys
+    
+    try:
+        import pytest
+    except ImportError:
+        raise click.ClickException("pytest is not installed. Install with: pip install pytest")
+    
+    try:
+        # Run the test suite in-process, streaming output to the terminal
+        returncode = int(pytest.main(['tests/', '-v', '--tb=short']))
+    except Exception as e:
+        raise click.ClickException(f"Test execution failed: {e}")
+    
+    if returncode == 0:
+        click.echo("[SUCCESS] All tests passed!")
+    else:
+        click.echo("[ERROR] Some tests failed!")
+        sys.exit(returncode)
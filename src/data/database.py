@@ -6,17 +6,19 @@ import os
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 from contextlib import contextmanager
+import csv
+import io
 import json
 import uuid
 from datetime import datetime
 
-from sqlalchemy import create_engine, func
+from sqlalchemy import DateTime, create_engine, event, func, insert
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 
 from .models import Base, Product, ScrapingSession, PriceHistory
 from src.utils.logger import LoggerMixin
-from src.utils.helpers import generate_hash
+from src.utils.helpers import generate_hash, chunks
 
 class DatabaseManager(LoggerMixin):
     """
@@ -62,11 +64,31 @@ class DatabaseManager(LoggerMixin):
             if not db_url.startswith('sqlite:'):
                 engine_kwargs.update({
                     'pool_size': self.config.get('database', {}).get('pool_size', 10),
-                    'max_overflow': self.config.get('database', {}).get('max_overflow', 20)
+                    'max_overflow': self.config.get('database', {}).get('max_overflow', 20),
+                    # Check pooled connections before use and retire them before
+                    # server idle timeouts, so long-lived managers survive gaps
+                    'pool_pre_ping': True,
+                    'pool_recycle': self.config.get('database', {}).get('pool_recycle', 1800)
                 })
             
+            # Batch executemany INSERTs into multi-row statements on Postgres
+            if db_url.startswith('postgresql'):
+                engine_kwargs['insertmanyvalues_page_size'] = self.config.get('database', {}).get('batch_size', 1000)
+                if db_url.startswith(('postgresql://', 'postgresql+psycopg2://')):
+                    engine_kwargs['executemany_mode'] = 'values_plus_batch'
+            
             self._engine = create_engine(db_url, **engine_kwargs)
             
+            # WAL journaling with relaxed syncing cuts fsync cost on SQLite writes
+            if db_url.startswith('sqlite:'):
+                event.listen(self._engine, 'connect', self._set_sqlite_pragmas)
+            
+            # COPY FROM STDIN is only available through the psycopg2 cursor
+            self._use_copy = (
+                self._engine.dialect.driver == 'psycopg2'
+                and self.config.get('database', {}).get('use_copy', True)
+            )
+            
             # Create session factory
             self._session_factory = sessionmaker(bind=self._engine)
             
@@ -79,6 +101,28 @@ class DatabaseManager(LoggerMixin):
             self.logger.error(f"Failed to initialize database: {e}")
             raise
     
+    @staticmethod
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Apply write-performance PRAGMAs to new SQLite connections."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+    
+    @contextmanager
+    def bulk_context(self) -> Session:
+        """
+        Context manager for bulk writes sharing one connection and transaction.
+        
+        Everything written through the yielded session is committed once on
+        exit, or rolled back together if any step fails.
+        
+        Yields:
+            SQLAlchemy session
+        """
+        with self.get_session() as session:
+            yield session
+    
     @contextmanager
     def get_session(self) -> Session:
         """
@@ -149,6 +193,188 @@ class DatabaseManager(LoggerMixin):
             self.logger.error(f"Failed to save product: {e}")
             return None
     
+    def save_products_bulk(self, products: List[Dict[str, Any]], session: Optional[Session] = None) -> int:
+        """
+        Save a batch of products to the database in a single transaction.
+
+        New products are written with one executemany INSERT instead of a
+        round-trip per row; products that already exist (same source and
+        product_id, with a missing product_id matching a stored NULL one)
+        are updated in place, as in save_product().
+
+        Args:
+            products: List of product dictionaries
+            session: Session from bulk_context() to write into; errors are
+                raised to the caller, who owns the transaction
+
+        Returns:
+            Number of products saved (inserted or updated)
+        """
+        if not products:
+            return 0
+
+        columns = set(Product.__table__.columns.keys()) - {'id'}
+        datetime_columns = {
+            c.name for c in Product.__table__.columns if isinstance(c.type, DateTime)
+        }
+
+        # Build insert rows, keyed for deduplication (last occurrence wins)
+        pending: Dict[tuple, Dict[str, Any]] = {}
+        for product_data in products:
+            hash_data = f"{product_data.get('source')}-{product_data.get('product_id')}-{product_data.get('title')}"
+            row = {k: v for k, v in product_data.items() if k in columns}
+            row['data_hash'] = generate_hash(hash_data)
+
+            # Accept pre-serialized ISO 8601 timestamps
+            for name in datetime_columns:
+                if isinstance(row.get(name), str):
+                    row[name] = datetime.fromisoformat(row[name])
+
+            key = (row.get('source'), row.get('product_id'))
+            if key in pending:
+                pending[key].update(row)
+            else:
+                pending[key] = row
+
+        return self.save_product_rows(pending, session=session)
+    
+    def save_product_rows(self, rows: Dict[tuple, Dict[str, Any]], session: Optional[Session] = None) -> int:
+        """
+        Save rows that are already Product column values, as built by
+        save_products_bulk(), skipping the per-row normalization.
+
+        Args:
+            rows: Column-value dicts (including data_hash) keyed by
+                (source, product_id); the dict is consumed
+            session: Session from bulk_context() to write into; errors are
+                raised to the caller, who owns the transaction
+
+        Returns:
+            Number of products saved (inserted or updated)
+        """
+        if not rows:
+            return 0
+
+        if session is not None:
+            return self._write_products_bulk(session, rows)
+        
+        try:
+            with self.get_session() as session:
+                return self._write_products_bulk(session, rows)
+        except Exception as e:
+            self.logger.error(f"Failed to bulk save products: {e}")
+            return 0
+    
+    def _write_products_bulk(self, session: Session, pending: Dict[tuple, Dict[str, Any]]) -> int:
+        """Insert or update keyed product rows within the given session."""
+        existing = self._find_existing_products(session, list(pending))
+
+        for key, product in existing.items():
+            row = pending.pop(key)
+            old_price = product.price
+            for field, value in row.items():
+                setattr(product, field, value)
+            if old_price != row.get('price'):
+                self._save_price_history(session, product, row.get('price'))
+
+        if pending:
+            if self._use_copy:
+                self._copy_rows(session, Product, list(pending.values()))
+            else:
+                session.execute(insert(Product), list(pending.values()))
+
+            # Initial price history for the newly inserted products
+            inserted = self._find_existing_products(session, list(pending))
+            history_rows = [
+                {
+                    'product_id': product.id,
+                    'source_product_id': product.product_id,
+                    'source': product.source,
+                    'price': product.price,
+                    'original_price': product.original_price,
+                    'discount_percent': product.discount_percent,
+                    'availability': product.availability,
+                    'condition': product.condition
+                }
+                for product in inserted.values() if product.price is not None
+            ]
+            if history_rows:
+                session.execute(insert(PriceHistory), history_rows)
+
+        self.logger.debug(
+            f"Bulk saved {len(pending)} new and {len(existing)} existing products"
+        )
+        return len(pending) + len(existing)
+
+    def _copy_rows(self, session: Session, model, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert rows with Postgres COPY FROM STDIN, bypassing per-row INSERTs.
+
+        Column defaults normally applied by SQLAlchemy are filled in here,
+        since COPY only sees the values written to the CSV buffer.
+
+        Args:
+            session: Active database session
+            model: Mapped model class to insert into
+            rows: List of column dictionaries
+        """
+        table = model.__table__
+        now = datetime.now()
+        defaults = {}
+        for column in table.columns:
+            if column.default is None:
+                continue
+            defaults[column.name] = now if column.default.is_clause_element else column.default.arg
+
+        present = set(defaults)
+        for row in rows:
+            present.update(row)
+        columns = [c.name for c in table.columns if c.name in present]
+
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for row in rows:
+            writer.writerow([
+                row[name] if row.get(name) is not None else defaults.get(name)
+                for name in columns
+            ])
+        buf.seek(0)
+
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH CSV", buf
+            )
+        finally:
+            cursor.close()
+
+    def _find_existing_products(self, session: Session, keys: List[tuple]) -> Dict[tuple, Product]:
+        """
+        Fetch products matching (source, product_id) keys, batching the IN lookups.
+
+        A None product_id matches a stored NULL one (the first per source),
+        as the filter_by() lookup in save_product() does.
+        """
+        wanted = set(keys)
+        found = {}
+
+        product_ids = list({product_id for _, product_id in wanted if product_id is not None})
+        for id_chunk in chunks(product_ids, 500):
+            for product in session.query(Product).filter(Product.product_id.in_(id_chunk)):
+                key = (product.source, product.product_id)
+                if key in wanted:
+                    found[key] = product
+
+        null_sources = list({source for source, product_id in wanted if product_id is None})
+        if null_sources:
+            query = (session.query(Product)
+                     .filter(Product.product_id.is_(None), Product.source.in_(null_sources))
+                     .order_by(Product.id))
+            for product in query:
+                found.setdefault((product.source, None), product)
+
+        return found
+
     def _save_price_history(self, session: Session, product: Product, price: float) -> None:
         """Save price history entry."""
         if price is None:
@@ -289,6 +515,20 @@ class DatabaseManager(LoggerMixin):
             self.logger.error(f"Failed to get products: {e}")
             return []
     
+    def count_products(self) -> int:
+        """
+        Count stored products with a single COUNT query.
+        
+        Returns:
+            Number of products in the database
+        """
+        try:
+            with self.get_session() as session:
+                return session.query(func.count(Product.id)).scalar() or 0
+        except Exception as e:
+            self.logger.error(f"Failed to count products: {e}")
+            return 0
+    
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get comprehensive database statistics.
@@ -308,7 +548,7 @@ class DatabaseManager(LoggerMixin):
         try:
             with self.get_session() as session:
                 stats = {
-                    'total_products': session.query(Product).count(),
+                    'total_products': session.query(func.count(Product.id)).scalar() or 0,
                     'products_by_source': {},
                     'avg_price': 0.0,
                     'latest_scrape': None,
@@ -107,6 +107,17 @@ class BaseScraper(ABC, LoggerMixin):
         # Set timeouts
         self.session.timeout = self.config.get('scraping', {}).get('timeout', 30)
     
+    def use_http_adapter(self, adapter) -> None:
+        """
+        Route this scraper's requests through a shared connection pool.
+        
+        Args:
+            adapter: requests HTTPAdapter shared with other scrapers
+        """
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._shared_adapter = adapter
+    
     def add_observer(self, observer: ScrapingObserver) -> None:
         """Add progress observer."""
         self.observers.append(observer)
@@ -217,6 +228,20 @@ class BaseScraper(ABC, LoggerMixin):
                 self.logger.warning(f"Anti-bot detection detected: {indicator}")
                 raise Exception(f"Anti-bot protection triggered: {indicator}")
     
+    def build_search_url(self, keyword: str, page: int = 1) -> str:
+        """
+        Build the search URL for a keyword and page, for callers that fetch
+        pages themselves.
+        
+        Args:
+            keyword: Search keyword
+            page: Page number
+            
+        Returns:
+            Complete search URL
+        """
+        return self._build_search_url(keyword, page)
+    
     def _build_search_url(self, keyword: str, page: int = 1) -> str:
         """
         Build search URL for given keyword and page.
@@ -402,6 +427,19 @@ class BaseScraper(ABC, LoggerMixin):
         
         return result
     
+    def scrape_page(self, keyword: str, page: int) -> List[Dict[str, Any]]:
+        """
+        Fetch and parse a single search results page outside of scrape().
+        
+        Args:
+            keyword: Search keyword
+            page: Page number
+            
+        Returns:
+            List of product data dictionaries
+        """
+        return self._scrape_page(keyword, page)
+    
     @abstractmethod
     def _scrape_page(self, keyword: str, page: int) -> List[Dict[str, Any]]:
         """
@@ -422,4 +460,9 @@ class BaseScraper(ABC, LoggerMixin):
     def close(self) -> None:
         """Clean up resources."""
         if hasattr(self, 'session'):
+            # Detach the shared pool first so closing this session keeps it alive
+            shared = getattr(self, '_shared_adapter', None)
+            for prefix, adapter in list(self.session.adapters.items()):
+                if adapter is shared:
+                    del self.session.adapters[prefix]
             self.session.close() 
\ No newline at end of file
@@ -19,6 +19,7 @@ from .selenium_scraper import SeleniumScraper
 from .scrapy_spider import ScrapyScraper
 from ..data.database import DatabaseManager
 from ..data.processors import DataProcessor
+from ..utils.helpers import chunks
 from ..utils.logger import setup_logger
 from ..utils.concurrent_manager import ConcurrentScrapingManager
 from ..utils.parallel_selenium_manager import ParallelSeleniumManager
@@ -34,14 +35,17 @@ class ScrapingManager:
     and handle the overall scraping workflow.
     """
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], http_adapter=None):
         """
         Initialize the scraping manager.
         
         Args:
             config: Application configuration dictionary
+            http_adapter: Optional requests HTTPAdapter shared by every scraper
+                this manager creates, so keep-alive connections are reused
         """
         self.config = config
+        self.http_adapter = http_adapter
         self.db_manager = DatabaseManager(config)
         self.data_processor = DataProcessor(config)
         
@@ -272,7 +276,7 @@ class ScrapingManager:
             page = task['page']
             
             # Create static scraper for this task
-            scraper = StaticScraper(source, self.config)
+            scraper = self._create_scraper(StaticScraper, source)
             
             # Scrape single page
             result = scraper.scrape(
@@ -429,7 +433,7 @@ class ScrapingManager:
                 try:
                     # Create scraper instance for this source
                     scraper_class = self.scraper_classes.get(scraper_type, self.scraper_classes['static'])
-                    scraper = scraper_class(source, self.config)
+                    scraper = self._create_scraper(scraper_class, source)
                     
                     source_results = []
                     for keyword in keywords:
@@ -509,24 +513,47 @@ class ScrapingManager:
         except Exception as e:
             logger.error(f"Failed to update scraping session: {e}")
     
+    def _create_scraper(self, scraper_class, source: str):
+        """Create a scraper for a source, attached to the shared HTTP pool if any."""
+        scraper = scraper_class(source, self.config)
+        if self.http_adapter is not None and hasattr(scraper, 'use_http_adapter'):
+            scraper.use_http_adapter(self.http_adapter)
+        return scraper
+    
     def _is_source_enabled(self, source: str) -> bool:
         """Check if a source is enabled in configuration."""
         sources_config = self.config.get('sources', {})
         source_config = sources_config.get(source, {})
         return source_config.get('enabled', False)
     
-    def _save_products(self, products: List[Dict[str, Any]]) -> int:
-        """Save products to database."""
+    def _save_products(self, products: List[Dict[str, Any]], batch_size: int = 512) -> int:
+        """
+        Save products to database, one transaction per batch.
+        
+        Args:
+            products: List of product dictionaries
+            batch_size: Number of products written per bulk insert
+            
+        Returns:
+            Number of products saved
+        """
         saved_count = 0
         
-        for product_data in products:
-            try:
-                result = self.db_manager.save_product(product_data)
-                if result:
-                    saved_count += 1
-            except Exception as e:
-                logger.error(f"Failed to save product: {e}")
+        for batch in chunks(products, batch_size):
+            batch_saved = self.db_manager.save_products_bulk(batch)
+            if batch_saved:
+                saved_count += batch_saved
                 continue
+            
+            # Bulk write failed; save row by row so one bad record doesn't drop the batch
+            for product_data in batch:
+                try:
+                    result = self.db_manager.save_product(product_data)
+                    if result:
+                        saved_count += 1
+                except Exception as e:
+                    logger.error(f"Failed to save product: {e}")
+                    continue
         
         return saved_count
     
@@ -587,7 +614,7 @@ class ScrapingManager:
         
         try:
             scraper_class = self.scraper_classes['static']
-            scraper = scraper_class(source, self.config)
+            scraper = self._create_scraper(scraper_class, source)
             
             # Test with just 1 page
             result = scraper.scrape(
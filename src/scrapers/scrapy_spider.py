@@ -28,7 +28,7 @@ class ProductSpider(scrapy.Spider):
     
     name = 'product_spider'
     
-    def __init__(self, source='amazon', keywords='laptop', max_pages=5, *args, **kwargs):
+    def __init__(self, source='amazon', keywords='laptop', max_pages=5, jobs=None, *args, **kwargs):
         """
         Initialize spider with configuration.
         
@@ -36,6 +36,8 @@ class ProductSpider(scrapy.Spider):
             source: Target website (amazon, ebay, walmart)
             keywords: Search keywords (comma-separated)
             max_pages: Maximum pages to scrape
+            jobs: Optional list of (source, keyword) pairs to crawl in this
+                single spider; overrides source/keywords when given
         """
         super(ProductSpider, self).__init__(*args, **kwargs)
         
@@ -44,6 +46,11 @@ class ProductSpider(scrapy.Spider):
         self.max_pages = int(max_pages)
         self.scraped_pages = 0
         
+        # Seed (source, keyword) pairs, all scheduled concurrently by Scrapy
+        if jobs is None:
+            jobs = [(source, keyword) for keyword in self.keywords]
+        self.jobs = [(job_source, job_keyword) for job_source, job_keyword in jobs]
+        
         # Source configuration
         self.source_configs = {
             'amazon': {
@@ -71,7 +78,7 @@ class ProductSpider(scrapy.Spider):
             }
         }
         
-        self.config = self.source_configs.get(source, self.source_configs['amazon'])
+        self.config = self._get_source_config(source)
         
         # Custom settings for this spider
         self.custom_settings = {
@@ -88,14 +95,15 @@ class ProductSpider(scrapy.Spider):
         }
     
     def start_requests(self):
-        """Generate initial requests for all keywords."""
-        for keyword in self.keywords:
-            # Start with page 1 for each keyword
-            url = self._build_search_url(keyword, 1)
+        """Generate initial requests for all (source, keyword) jobs."""
+        for source, keyword in self.jobs:
+            # Start with page 1 for each job
+            url = self._build_search_url(keyword, 1, source)
             yield Request(
                 url=url,
                 callback=self.parse_search_page,
                 meta={
+                    'source': source,
                     'keyword': keyword,
                     'page': 1
                 },
@@ -112,14 +120,15 @@ class ProductSpider(scrapy.Spider):
         Yields:
             Product items and next page requests
         """
+        source = response.meta.get('source', self.source)
         keyword = response.meta['keyword']
         page = response.meta['page']
         
-        self.logger.info(f"Parsing {self.source} page {page} for keyword: {keyword}")
+        self.logger.info(f"Parsing {source} page {page} for keyword: {keyword}")
         
         # Extract products from current page
         products_found = 0
-        for product in self._extract_products(response, keyword, page):
+        for product in self._extract_products(response, keyword, page, source):
             products_found += 1
             yield product
         
@@ -128,19 +137,20 @@ class ProductSpider(scrapy.Spider):
         # Generate next page request if within limits
         if page < self.max_pages and products_found > 0:
             next_page = page + 1
-            next_url = self._build_search_url(keyword, next_page)
+            next_url = self._build_search_url(keyword, next_page, source)
             
             yield Request(
                 url=next_url,
                 callback=self.parse_search_page,
                 meta={
+                    'source': source,
                     'keyword': keyword,
                     'page': next_page
                 },
                 headers=self._get_headers()
             )
     
-    def _extract_products(self, response, keyword, page):
+    def _extract_products(self, response, keyword, page, source=None):
         """
         Extract product data from search page.
         
@@ -148,11 +158,13 @@ class ProductSpider(scrapy.Spider):
             response: Scrapy response object
             keyword: Search keyword
             page: Page number
+            source: Source the page belongs to (defaults to the spider's source)
             
         Yields:
             Product item dictionaries
         """
-        selectors = self.config['selectors']
+        source = source or self.source
+        selectors = self._get_source_config(source)['selectors']
         containers = response.css(selectors['product_container'])
         
         for i, container in enumerate(containers, 1):
@@ -187,7 +199,7 @@ class ProductSpider(scrapy.Spider):
                 
                 # Create product item
                 product = {
-                    'source': self.source,
+                    'source': source,
                     'title': title,
                     'url': url,
                     'price': price,
@@ -201,7 +213,7 @@ class ProductSpider(scrapy.Spider):
                 }
                 
                 # Extract product ID based on source
-                if self.source == 'amazon' and url:
+                if source == 'amazon' and url:
                     asin_match = re.search(r'/dp/([A-Z0-9]{10})', url)
                     if asin_match:
                         product['product_id'] = asin_match.group(1)
@@ -212,10 +224,15 @@ class ProductSpider(scrapy.Spider):
                 self.logger.error(f"Error extracting product {i} on page {page}: {e}")
                 continue
     
-    def _build_search_url(self, keyword, page):
+    def _get_source_config(self, source):
+        """Get the site configuration for a source, defaulting to Amazon."""
+        return self.source_configs.get(source, self.source_configs['amazon'])
+    
+    def _build_search_url(self, keyword, page, source=None):
         """Build search URL for given keyword and page."""
-        base_url = self.config['base_url']
-        search_path = self.config['search_path'].format(
+        config = self._get_source_config(source or self.source)
+        base_url = config['base_url']
+        search_path = config['search_path'].format(
             keyword=keyword.replace(' ', '+'),
             page=page
         )
@@ -290,14 +307,13 @@ class ScrapyScraper:
             # Create crawler process
             process = CrawlerProcess(settings)
             
-            # Add spider to crawler
-            for keyword in keywords:
-                process.crawl(
-                    ProductSpider,
-                    source=self.source,
-                    keywords=keyword,
-                    max_pages=max_pages
-                )
+            # One spider seeded with every keyword, crawled concurrently
+            process.crawl(
+                ProductSpider,
+                source=self.source,
+                jobs=[(self.source, keyword) for keyword in keywords],
+                max_pages=max_pages
+            )
             
             # Run crawler (this blocks until completion)
             if not process.crawlers:
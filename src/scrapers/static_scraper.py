@@ -175,23 +175,36 @@ class StaticScraper(BaseScraper):
             # Make request
             response = self._make_request(url)
             
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract products based on source
-            if self.source == 'amazon':
-                return self._extract_amazon_products(soup, keyword, page)
-            elif self.source == 'ebay':
-                return self._extract_ebay_products(soup, keyword, page)
-            elif self.source == 'walmart':
-                return self._extract_walmart_products(soup, keyword, page)
-            else:
-                return self._extract_generic_products(soup, keyword, page)
+            return self.parse_page(response.text, keyword, page)
                 
         except Exception as e:
             self.logger.error(f"Failed to scrape page {page} for '{keyword}': {e}")
             raise
     
+    def parse_page(self, html: str, keyword: str, page: int) -> List[Dict[str, Any]]:
+        """
+        Parse an already-fetched search results page.
+        
+        Args:
+            html: Raw HTML of the search results page
+            keyword: Search keyword
+            page: Page number
+            
+        Returns:
+            List of product data dictionaries
+        """
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # Extract products based on source
+        if self.source == 'amazon':
+            return self._extract_amazon_products(soup, keyword, page)
+        elif self.source == 'ebay':
+            return self._extract_ebay_products(soup, keyword, page)
+        elif self.source == 'walmart':
+            return self._extract_walmart_products(soup, keyword, page)
+        else:
+            return self._extract_generic_products(soup, keyword, page)
+    
     def _extract_amazon_products(self, soup: BeautifulSoup, keyword: str, page: int) -> List[Dict[str, Any]]:
         """
         Extract products from Amazon search results.
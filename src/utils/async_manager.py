@@ -0,0 +1,224 @@
+"""
+Asynchronous Scraping Manager
+
+This module runs I/O-bound static page fetches on a single asyncio event
+loop with aiohttp, so hundreds of requests can be in flight without a
+thread per request.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# libuv-backed event loop; not available on Windows, where asyncio's
+# default Proactor loop is used instead
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = sys.platform != 'win32'
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+from .helpers import backoff_delay, get_random_headers, parse_retry_after
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Status codes that signal throttling or a transient origin failure
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Per-process parser state for parse pool workers
+_parse_config: Dict[str, Any] = {}
+_parse_scrapers: Dict[str, Any] = {}
+
+def _init_parse_worker(config: Dict[str, Any]) -> None:
+    """Load the parsing stack once in each parse pool worker."""
+    global _parse_config
+    _parse_config = config
+
+    import bs4  # noqa: F401
+    try:
+        import lxml.html  # noqa: F401
+    except ImportError:
+        pass
+
+def parse_listing(source: str, html: str, keyword: str, page: int) -> List[Dict[str, Any]]:
+    """
+    Parse a fetched search page in a parse pool worker.
+
+    Args:
+        source: Source name
+        html: Raw HTML of the search results page
+        keyword: Search keyword
+        page: Page number
+
+    Returns:
+        List of product data dictionaries
+    """
+    scraper = _parse_scrapers.get(source)
+    if scraper is None:
+        from src.scrapers.static_scraper import StaticScraper
+        scraper = _parse_scrapers[source] = StaticScraper(source, _parse_config)
+    return scraper.parse_page(html, keyword, page)
+
+def create_parse_pool(config: Dict[str, Any], max_workers: Optional[int] = None) -> Optional[ProcessPoolExecutor]:
+    """
+    Create a process pool for HTML parsing, or None on a single-core machine.
+
+    Args:
+        config: Configuration dictionary passed to every worker once
+        max_workers: Worker processes (defaults to the CPU count)
+
+    Returns:
+        ProcessPoolExecutor, or None when parsing should stay on a thread
+    """
+    workers = max_workers or os.cpu_count() or 1
+    if workers < 2:
+        return None
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_parse_worker, initargs=(config,))
+
+def run_async(coro):
+    """
+    Run a coroutine to completion on uvloop when installed, else asyncio's loop.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    if not UVLOOP_AVAILABLE:
+        return asyncio.run(coro)
+
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+
+    # asyncio.Runner is 3.11+; swap the loop policy for this run only
+    previous_policy = asyncio.get_event_loop_policy()
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    try:
+        return asyncio.run(coro)
+    finally:
+        asyncio.set_event_loop_policy(previous_policy)
+
+async def fetch_all(jobs: Iterable[Any],
+                    worker_coro: Callable[['aiohttp.ClientSession', Any], Awaitable[List[Dict[str, Any]]]],
+                    max_concurrency: int = 64,
+                    per_host: int = 8) -> List[Dict[str, Any]]:
+    """
+    Run a worker coroutine for every job over one shared HTTP session.
+
+    Args:
+        jobs: Job descriptions passed to the worker one at a time
+        worker_coro: Coroutine ``(session, job) -> list of records``
+        max_concurrency: Maximum number of jobs in flight at once
+        per_host: Maximum open connections per host
+
+    Returns:
+        Flattened list of records from all successful jobs
+    """
+    if not AIOHTTP_AVAILABLE:
+        raise ImportError("aiohttp is required for asynchronous scraping")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    connector = aiohttp.TCPConnector(limit=max_concurrency, limit_per_host=per_host, ttl_dns_cache=300)
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        async def run_job(job):
+            async with semaphore:
+                try:
+                    return await worker_coro(session, job)
+                except Exception as e:
+                    logger.error(f"Async job {job} failed: {e}")
+                    return []
+
+        batches = await asyncio.gather(*(run_job(job) for job in jobs))
+
+    results = [record for batch in batches for record in batch]
+    logger.info(f"Async scraping completed: {len(results)} results")
+    return results
+
+def make_static_page_worker(config: Dict[str, Any], timeout: float = 30,
+                            max_retries: int = 5, backoff_base: float = 0.25,
+                            parse_pool: Optional[ProcessPoolExecutor] = None):
+    """
+    Build a worker coroutine that fetches and parses one static search page.
+
+    Pages are fetched with aiohttp and handed to the source's StaticScraper
+    parser in parse_pool (from create_parse_pool) or, without one, in a
+    worker thread, so parsing never blocks the event loop.
+    Throttled or failed requests are retried with exponential backoff, and a
+    Retry-After from one response pauses every pending request to that host.
+
+    Args:
+        config: Configuration dictionary
+        timeout: Per-request timeout in seconds
+        max_retries: Retries per page after the first attempt
+        backoff_base: Delay for the first retry in seconds
+        parse_pool: Process pool that parses pages in parallel across cores
+
+    Returns:
+        Coroutine ``(session, (source, keyword, page)) -> list of products``
+    """
+    from src.scrapers.static_scraper import StaticScraper
+
+    scrapers: Dict[str, StaticScraper] = {}
+    request_timeout = aiohttp.ClientTimeout(total=timeout)
+    host_resume_at: Dict[str, float] = {}
+
+    async def fetch_html(session: 'aiohttp.ClientSession', url: str) -> str:
+        host = urlparse(url).netloc
+
+        for attempt in range(max_retries + 1):
+            # Honour a pause requested by an earlier response from this host
+            wait = host_resume_at.get(host, 0.0) - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            retry_after = None
+            try:
+                async with session.get(url, headers=get_random_headers(), timeout=request_timeout) as response:
+                    if response.status not in RETRYABLE_STATUSES:
+                        response.raise_for_status()
+                        return await response.text()
+
+                    retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                    error = f"HTTP {response.status}"
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                error = str(e) or type(e).__name__
+
+            if attempt == max_retries:
+                raise aiohttp.ClientError(f"{url} failed after {max_retries} retries: {error}")
+
+            delay = backoff_delay(attempt, backoff_base, retry_after)
+            if retry_after is not None:
+                host_resume_at[host] = max(host_resume_at.get(host, 0.0), time.monotonic() + retry_after)
+            logger.warning(f"{error} for {url}, retrying in {delay:.2f}s (attempt {attempt + 1})")
+            await asyncio.sleep(delay)
+
+    async def scrape_page(session: 'aiohttp.ClientSession',
+                          job: Tuple[str, str, int]) -> List[Dict[str, Any]]:
+        source, keyword, page = job
+
+        scraper = scrapers.get(source)
+        if scraper is None:
+            scraper = scrapers[source] = StaticScraper(source, config)
+
+        url = scraper.build_search_url(keyword, page)
+        html = await fetch_html(session, url)
+        if parse_pool is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(parse_pool, parse_listing, source, html, keyword, page)
+        return await asyncio.to_thread(scraper.parse_page, html, keyword, page)
+
+    return scrape_page
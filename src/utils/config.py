@@ -3,6 +3,8 @@ Configuration management module for loading and managing application settings.
 """
 
 import os
+import copy
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
@@ -22,6 +24,19 @@ except ImportError:
                 "Could not import yaml. Please install with: pip install PyYAML"
             )
 
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', None) or getattr(yaml, 'SafeLoader', None)
+
+# Parsed configs are also kept in a JSON sidecar, which loads much faster
+# than YAML on later startups; orjson is preferred when installed
+try:
+    import orjson
+    _json_loads, _json_dumps = orjson.loads, orjson.dumps
+except ImportError:
+    import json
+    _json_loads = json.loads
+    _json_dumps = lambda obj: json.dumps(obj).encode('utf-8')
+
 logger = logging.getLogger(__name__)
 
 # Global configuration cache
@@ -49,8 +64,10 @@ def load_config(config_path: str = 'config/settings.yaml') -> Dict[str, Any]:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
     try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        # Parsed YAML is reused until the file changes; callers get their own copy
+        config = copy.deepcopy(
+            _parse_config_file(str(config_file.resolve()), config_file.stat().st_mtime_ns)
+        )
             
         # Cache the configuration
         _config_cache = config
@@ -66,6 +83,83 @@ def load_config(config_path: str = 'config/settings.yaml') -> Dict[str, Any]:
     except Exception as e:
         raise Exception(f"Error loading configuration: {e}")
 
+@lru_cache(maxsize=4)
+def _parse_config_file(resolved_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML configuration file, memoized on path and modification time.
+    
+    Args:
+        resolved_path: Absolute path to the configuration file
+        mtime_ns: File modification time, so edits invalidate the cache entry
+        
+    Returns:
+        Parsed configuration dictionary (shared; do not mutate)
+    """
+    # Reuse the JSON sidecar while it is at least as new as the YAML file
+    cache_path = Path(resolved_path).with_suffix('.json.cache')
+    try:
+        if cache_path.stat().st_mtime_ns >= mtime_ns:
+            return _json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        pass
+    
+    config = _read_yaml(resolved_path)
+    _write_config_cache(cache_path, config)
+    return config
+
+def load_config_uncached(config_path: str = 'config/settings.yaml') -> Dict[str, Any]:
+    """
+    Load and validate a configuration file straight from its YAML.
+    
+    Skips the in-process memo and the JSON sidecar, so every call pays a
+    full parse; meant for measuring cold loads.
+    
+    Args:
+        config_path: Path to the configuration file
+        
+    Returns:
+        Dictionary containing configuration settings
+        
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+    """
+    if not Path(config_path).exists():
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    
+    config = _read_yaml(config_path)
+    _validate_config(config)
+    return config
+
+def _read_yaml(path: str) -> Dict[str, Any]:
+    """Parse a YAML file with the fastest available safe loader."""
+    with open(path, 'r', encoding='utf-8') as f:
+        if _YAML_LOADER is not None:
+            return yaml.load(f, Loader=_YAML_LOADER)
+        return yaml.safe_load(f)
+
+def _write_config_cache(cache_path: Path, config: Dict[str, Any]) -> None:
+    """
+    Write a parsed configuration to its JSON sidecar.
+    
+    Skipped when the config holds values JSON cannot round-trip (such as
+    dates), so the sidecar never changes what load_config returns.
+    
+    Args:
+        cache_path: Sidecar file path
+        config: Parsed configuration dictionary
+    """
+    try:
+        data = _json_dumps(config)
+        if _json_loads(data) != config:
+            return
+        
+        # Write then rename, so a concurrent reader never sees a partial file
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write config cache {cache_path}: {e}")
+
 def get_config(key_path: Optional[str] = None) -> Any:
     """
     Get configuration value by key path.
@@ -31,10 +31,10 @@ class DataCollectionStrategy:
     5. Fallback strategies
     """
     
-    def __init__(self, config: Dict[str, Any]):
-        """Initialize strategic collection manager."""
+    def __init__(self, config: Dict[str, Any], http_adapter=None):
+        """Initialize strategic collection manager, optionally sharing an HTTP connection pool."""
         self.config = config
-        self.scraping_manager = ScrapingManager(config)
+        self.scraping_manager = ScrapingManager(config, http_adapter=http_adapter)
         self.concurrent_manager = ConcurrentScrapingManager(config)
         self.db_manager = DatabaseManager(config)
         
@@ -138,9 +138,7 @@ class DataCollectionStrategy:
             collection_results['duration'] = collection_results['end_time'] - start_time
             
             # Calculate success metrics
-            successful = sum(1 for session in collection_results['sessions'] if session.get('success', False))
-            collection_results['successful_sessions'] = successful
-            collection_results['failed_sessions'] = len(collection_results['sessions']) - successful
+            collection_results.update(self._summarize_sessions(collection_results['sessions']))
             
             logger.info(f"🎉 Collection completed: {final_count} total records")
             return collection_results
@@ -150,6 +148,31 @@ class DataCollectionStrategy:
             collection_results['error'] = str(e)
             return collection_results
     
+    @staticmethod
+    def _summarize_sessions(sessions: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Tally session outcomes in a single pass.
+        
+        Args:
+            sessions: Session result dictionaries
+            
+        Returns:
+            Successful/failed session counts and records found by successful sessions
+        """
+        successful = failed = records_found = 0
+        for session in sessions:
+            if session.get('success', False):
+                successful += 1
+                records_found += session.get('records_found', 0)
+            else:
+                failed += 1
+        
+        return {
+            'successful_sessions': successful,
+            'failed_sessions': failed,
+            'records_found': records_found
+        }
+    
     def _execute_diverse_keywords(self) -> List[Dict[str, Any]]:
         """Execute diverse keyword strategy."""
         sessions = []
@@ -344,8 +367,7 @@ class DataCollectionStrategy:
                             
                             if result.success:
                                 # Save results manually
-                                for product in result.data:
-                                    self.db_manager.save_product(product)
+                                self.db_manager.save_products_bulk(result.data)
                 
                 elif alt['approach'] == 'concurrent_batch':
                     # Use concurrent processing
@@ -389,8 +411,7 @@ class DataCollectionStrategy:
     def _get_current_record_count(self) -> int:
         """Get current number of records in database."""
         try:
-            stats = self.db_manager.get_product_stats()
-            return stats.get('total_products', 0)
+            return self.db_manager.count_products()
         except Exception as e:
             logger.error(f"Failed to get record count: {e}")
             return 0
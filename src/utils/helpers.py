@@ -232,6 +232,68 @@ def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
         return wrapper
     return decorator
 
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into a number of seconds.
+    
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+        
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    
+    try:
+        from email.utils import parsedate_to_datetime
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def backoff_delay(attempt: int, base: float = 0.25, retry_after: Optional[float] = None) -> float:
+    """
+    Compute a jittered exponential backoff delay.
+    
+    Args:
+        attempt: Zero-based retry attempt
+        base: Delay for the first retry in seconds
+        retry_after: Server-requested delay, honoured as a lower bound
+        
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    delay = base * (2 ** attempt) * random.uniform(0.5, 1.5)
+    return max(retry_after or 0.0, delay)
+
+def create_http_adapter(pool_connections: int = 16, pool_maxsize: int = 64,
+                        max_retries: int = 3, backoff_factor: float = 0.5):
+    """
+    Create a requests HTTPAdapter whose keep-alive pool can be shared by sessions.
+    
+    Args:
+        pool_connections: Number of per-host pools to keep
+        pool_maxsize: Maximum open connections per host pool
+        max_retries: Retries for connection errors
+        backoff_factor: Backoff factor between retries
+        
+    Returns:
+        Configured HTTPAdapter
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    return HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=max_retries, backoff_factor=backoff_factor)
+    )
+
 def validate_url(url: str) -> bool:
     """
     Validate if string is a valid URL.
@@ -5,6 +5,7 @@ Logging configuration and utilities for the Multi-Source Data Collection System.
 import logging
 import logging.handlers
 import sys
+import threading
 import time
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -13,6 +14,10 @@ import os
 # Global logger configuration
 _loggers: Dict[str, logging.Logger] = {}
 
+# Guards first-time configuration, so concurrent workers never attach
+# duplicate handlers to the same logger
+_loggers_lock = threading.Lock()
+
 def setup_logger(
     name: str,
     level: str = 'INFO',
@@ -35,10 +40,22 @@ def setup_logger(
     Returns:
         Configured logger instance
     """
-    # Use cached logger if already configured
-    if name in _loggers:
+    # Use cached logger if already configured (lock-free fast path)
+    logger = _loggers.get(name)
+    if logger is not None:
+        return logger
+    
+    with _loggers_lock:
+        if name not in _loggers:
+            _loggers[name] = _configure_logger(
+                name, level, log_file, format_string, max_bytes, backup_count
+            )
         return _loggers[name]
-    
+
+def _configure_logger(name: str, level: str, log_file: Optional[str],
+                      format_string: Optional[str], max_bytes: int,
+                      backup_count: int) -> logging.Logger:
+    """Attach handlers to a logger; called once per name under _loggers_lock."""
     # Create logger
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
@@ -77,9 +94,6 @@ def setup_logger(
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
     
-    # Cache the logger
-    _loggers[name] = logger
-    
     return logger
 
 def get_logger(name: str) -> logging.Logger:
@@ -54,10 +54,10 @@ class OptimizedCollectionStrategy:
     6. Smart retry mechanisms
     """
     
-    def __init__(self, config: Dict[str, Any]):
-        """Initialize optimized collection strategy."""
+    def __init__(self, config: Dict[str, Any], http_adapter=None):
+        """Initialize optimized collection strategy, optionally sharing an HTTP connection pool."""
         self.config = config
-        self.scraping_manager = ScrapingManager(config)
+        self.scraping_manager = ScrapingManager(config, http_adapter=http_adapter)
         self.concurrent_manager = ConcurrentScrapingManager(config)
         self.db_manager = DatabaseManager(config)
         
@@ -92,7 +92,10 @@ class OptimizedCollectionStrategy:
             Collection results and performance metrics
         """
         self.target_records = target
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        
+        # Start from clean counters when the strategy is reused across runs
+        self.stats = dict.fromkeys(self.stats, 0)
         
         logger.info(f"🚀 Starting OPTIMIZED collection (target: {target:,} records)")
         logger.info(f"⚡ Using {self.max_workers} parallel workers")
@@ -122,13 +125,13 @@ class OptimizedCollectionStrategy:
                     time.sleep(5)
             
             # Compile final results
-            end_time = time.time()
+            total_time = (time.perf_counter_ns() - start_ns) / 1e9
             final_count = self._get_current_record_count()
             
             results = {
                 'total_records': final_count,
-                'records_per_second': final_count / (end_time - start_time),
-                'total_time': end_time - start_time,
+                'records_per_second': final_count / total_time if total_time > 0 else 0,
+                'total_time': total_time,
                 'batches_processed': len(batches),
                 'tasks_completed': self.stats['completed_tasks'],
                 'tasks_failed': self.stats['failed_tasks'],
@@ -236,7 +239,7 @@ class OptimizedCollectionStrategy:
             )
             
             # Update last request time for this domain
-            self.domain_last_request[task.source] = time.time()
+            self.domain_last_request[task.source] = time.monotonic()
             
             return {
                 'success': True,
@@ -257,7 +260,7 @@ class OptimizedCollectionStrategy:
     def _wait_for_domain_rate_limit(self, domain: str) -> None:
         """Wait for domain-specific rate limiting."""
         if domain in self.domain_last_request:
-            elapsed = time.time() - self.domain_last_request[domain]
+            elapsed = time.monotonic() - self.domain_last_request[domain]
             required_delay = self.domain_delays.get(domain, 2.0)
             
             if elapsed < required_delay:
@@ -267,8 +270,7 @@ class OptimizedCollectionStrategy:
     def _get_current_record_count(self) -> int:
         """Get current number of records in database."""
         try:
-            stats = self.db_manager.get_statistics()
-            return stats.get('total_products', 0) if stats else 0
+            return self.db_manager.count_products()
         except Exception:
             return 0
     
@@ -296,25 +298,25 @@ class OptimizedCollectionStrategy:
         def optimized_worker(source, keyword, page, scraper_type):
             # Add small domain-specific delay
             if source in self.domain_last_request:
-                elapsed = time.time() - self.domain_last_request[source]
+                elapsed = time.monotonic() - self.domain_last_request[source]
                 if elapsed < self.domain_delays.get(source, 2.0):
                     time.sleep(self.domain_delays.get(source, 2.0) - elapsed)
             
             result = self.scraping_manager.scrape_single(source, keyword, page, scraper_type)
-            self.domain_last_request[source] = time.time()
+            self.domain_last_request[source] = time.monotonic()
             return result
         
         # Execute with performance tracking
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         results = self.concurrent_manager.execute_concurrent_scraping(optimized_worker)
-        end_time = time.time()
+        collection_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         final_count = self._get_current_record_count()
         
         return {
             'total_records': final_count,
-            'collection_time': end_time - start_time,
-            'records_per_second': final_count / (end_time - start_time) if (end_time - start_time) > 0 else 0,
+            'collection_time': collection_time,
+            'records_per_second': final_count / collection_time if collection_time > 0 else 0,
             'concurrent_results': len(results),
             'target_achieved': final_count >= target
         }
@@ -6,6 +6,7 @@ anti-bot protection across multiple browser instances simultaneously.
 """
 
 import asyncio
+import atexit
 import time
 import random
 import threading
@@ -57,16 +58,19 @@ class ParallelSeleniumManager:
     - Resource management and cleanup
     """
     
-    def __init__(self, config: Dict[str, Any], max_browsers: int = 4):
+    def __init__(self, config: Dict[str, Any], max_browsers: int = 4, keep_browsers: bool = False):
         """
         Initialize parallel Selenium manager.
         
         Args:
             config: Application configuration
             max_browsers: Maximum number of concurrent browser instances
+            keep_browsers: Leave browsers open between runs for reuse; they
+                are quit by shutdown() or at interpreter exit
         """
         self.config = config
         self.max_browsers = min(max_browsers, 8)  # Reasonable limit
+        self.keep_browsers = keep_browsers
         self.active_browsers = {}
         self.task_queue = queue.Queue()
         self.result_queue = queue.Queue()
@@ -81,6 +85,9 @@ class ParallelSeleniumManager:
         self.shutdown_event = threading.Event()
         self.lock = threading.Lock()
         
+        if keep_browsers:
+            atexit.register(self.shutdown)
+        
         logger.info(f"🚀 ParallelSeleniumManager initialized with {self.max_browsers} browsers")
     
     def execute_parallel_scraping(
@@ -104,6 +111,11 @@ class ParallelSeleniumManager:
         """
         logger.info(f"🚀 Starting parallel scraping: {len(sources)} sources, {len(keywords)} keywords")
         
+        # Reset per-run state so the manager can be run again
+        self.task_queue = queue.Queue()
+        self.result_queue = queue.Queue()
+        self.shutdown_event.clear()
+        
         # Reset stats
         self.stats['start_time'] = time.time()
         self.stats['tasks_completed'] = 0
@@ -189,6 +201,17 @@ class ParallelSeleniumManager:
         
         return max(1, base_priority + source_bonus - page_penalty - keyword_penalty)
     
+    def _record_result(self, result: ParallelResult, results: List[ParallelResult]):
+        """Append a worker result and update the shared stats."""
+        results.append(result)
+        
+        with self.lock:
+            if result.success:
+                self.stats['tasks_completed'] += 1
+                self.stats['total_products'] += len(result.data)
+            else:
+                self.stats['tasks_failed'] += 1
+    
     def _execute_parallel_workers(self) -> List[ParallelResult]:
         """Execute tasks using parallel worker threads."""
         results = []
@@ -204,23 +227,20 @@ class ParallelSeleniumManager:
             # Monitor progress and collect results
             logger.info(f"⚡ Started {self.max_browsers} parallel workers")
             
-            # Wait for completion or early termination
+            # Wait until every queued task (including retries) is done, the
+            # workers have all exited, or shutdown is requested
             completed_tasks = 0
-            while completed_tasks < self.task_queue.qsize() and not self.shutdown_event.is_set():
+            while not self.shutdown_event.is_set() and (
+                not self.result_queue.empty() or
+                (self.task_queue.unfinished_tasks > 0 and
+                 any(not future.done() for future in future_to_worker))
+            ):
                 try:
                     # Get result with timeout
                     result = self.result_queue.get(timeout=1.0)
-                    results.append(result)
+                    self._record_result(result, results)
                     completed_tasks += 1
                     
-                    # Update stats
-                    with self.lock:
-                        if result.success:
-                            self.stats['tasks_completed'] += 1
-                            self.stats['total_products'] += len(result.data)
-                        else:
-                            self.stats['tasks_failed'] += 1
-                    
                     # Log progress
                     if completed_tasks % 5 == 0:
                         self._log_progress(completed_tasks)
@@ -230,6 +250,14 @@ class ParallelSeleniumManager:
                 except Exception as e:
                     logger.error(f"Error collecting results: {e}")
             
+            # A worker may have queued its last result between the loop's
+            # queue check and its unfinished-task check
+            while True:
+                try:
+                    self._record_result(self.result_queue.get_nowait(), results)
+                except queue.Empty:
+                    break
+            
             # Signal shutdown
             self.shutdown_event.set()
             
@@ -242,8 +270,9 @@ class ParallelSeleniumManager:
                 except Exception as e:
                     logger.error(f"Worker {worker_id} failed: {e}")
         
-        # Cleanup browsers
-        self._cleanup_browsers()
+        # Cleanup browsers unless they are kept warm for the next run
+        if not self.keep_browsers:
+            self._cleanup_browsers()
         
         return results
     
@@ -263,15 +292,19 @@ class ParallelSeleniumManager:
                     # Get next task
                     task = self.task_queue.get(timeout=2.0)
                     
-                    # Process task
-                    result = self._process_task(browser, task, worker_id)
+                    try:
+                        # Process task on this worker's long-lived browser
+                        result = self._process_task(browser, task, worker_id)
+                        
+                        # Add result to queue
+                        self.result_queue.put(result)
+                        processed_tasks += 1
+                    finally:
+                        # Mark task as done
+                        self.task_queue.task_done()
                     
-                    # Add result to queue
-                    self.result_queue.put(result)
-                    processed_tasks += 1
-                    
-                    # Mark task as done
-                    self.task_queue.task_done()
+                    # Reset session state instead of restarting Chrome
+                    self._reset_browser_session(browser)
                     
                     # Small delay to prevent overwhelming
                     time.sleep(random.uniform(0.5, 1.5))
@@ -288,7 +321,7 @@ class ParallelSeleniumManager:
         
         finally:
             # Cleanup browser
-            if browser:
+            if browser and not self.keep_browsers:
                 try:
                     browser.close()
                     logger.debug(f"🤖 Worker {worker_id} browser closed")
@@ -298,7 +331,13 @@ class ParallelSeleniumManager:
             logger.info(f"🤖 Worker {worker_id} finished (processed {processed_tasks} tasks)")
     
     def _create_worker_browser(self, worker_id: int) -> AdvancedSeleniumScraper:
-        """Create a browser instance for a worker thread."""
+        """Create a browser instance for a worker thread, reusing one kept from an earlier run."""
+        with self.lock:
+            browser = self.active_browsers.get(worker_id)
+        if browser is not None:
+            logger.debug(f"♻️ Reusing browser for worker {worker_id}")
+            return browser
+        
         try:
             # Create unique config for this worker
             worker_config = self.config.copy()
@@ -321,6 +360,20 @@ class ParallelSeleniumManager:
             logger.error(f"Failed to create browser for worker {worker_id}: {e}")
             raise
     
+    def _reset_browser_session(self, browser: AdvancedSeleniumScraper) -> None:
+        """Clear cookies between tasks so one browser can be reused for the whole run."""
+        if browser.driver is None:
+            return
+        
+        try:
+            browser.driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        except Exception:
+            # Not a Chromium driver; fall back to the WebDriver API
+            try:
+                browser.driver.delete_all_cookies()
+            except Exception as e:
+                logger.debug(f"Could not reset browser session: {e}")
+    
     def _process_task(self, browser: AdvancedSeleniumScraper, task: ScrapingTask, worker_id: int) -> ParallelResult:
         """Process a single scraping task."""
         start_time = time.time()
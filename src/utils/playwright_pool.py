@@ -0,0 +1,94 @@
+"""
+Playwright Browser Pool
+
+This module renders JavaScript-heavy search pages with one headless
+Chromium process driven from a single asyncio event loop. Each page is
+loaded in its own short-lived BrowserContext, so sessions stay isolated
+without starting a new browser per task.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+from .helpers import get_random_user_agent
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+async def run_pool(config: Dict[str, Any], sources: List[str], keywords: List[str],
+                   max_pages: int, target: Optional[int] = None,
+                   n_contexts: int = 4, timeout: float = 30) -> Dict[str, Any]:
+    """
+    Scrape every (source, keyword, page) combination through a Playwright context pool.
+
+    Args:
+        config: Configuration dictionary
+        sources: Sources to scrape
+        keywords: Search keywords
+        max_pages: Pages per source and keyword
+        target: Stop starting new pages once this many products are collected
+        n_contexts: Maximum browser contexts open at once
+        timeout: Page load timeout in seconds
+
+    Returns:
+        Dictionary with the collected products and task counts
+    """
+    if not PLAYWRIGHT_AVAILABLE:
+        raise ImportError("playwright is required for the browser pool")
+
+    from src.scrapers.static_scraper import StaticScraper
+
+    jobs = [(source, keyword, page)
+            for source in sources
+            for keyword in keywords
+            for page in range(1, max_pages + 1)]
+
+    scrapers = {source: StaticScraper(source, config) for source in sources}
+    semaphore = asyncio.Semaphore(n_contexts)
+    products: List[Dict[str, Any]] = []
+    stats = {'tasks_completed': 0, 'tasks_failed': 0}
+
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+
+        async def run_job(job: Tuple[str, str, int]) -> None:
+            source, keyword, page_number = job
+            async with semaphore:
+                if target and len(products) >= target:
+                    return
+
+                scraper = scrapers[source]
+                context = await browser.new_context(user_agent=get_random_user_agent())
+                try:
+                    page = await context.new_page()
+                    await page.goto(scraper.build_search_url(keyword, page_number),
+                                    wait_until='domcontentloaded', timeout=timeout * 1000)
+                    html = await page.content()
+
+                    # Parse off the loop while still holding the slot, so the
+                    # target check above sees this page's products
+                    products.extend(await asyncio.to_thread(scraper.parse_page, html, keyword, page_number))
+                    stats['tasks_completed'] += 1
+                except Exception as e:
+                    stats['tasks_failed'] += 1
+                    logger.error(f"Browser job {job} failed: {e}")
+                finally:
+                    await context.close()
+
+        try:
+            await asyncio.gather(*(run_job(job) for job in jobs))
+        finally:
+            await browser.close()
+
+    logger.info(f"Browser pool completed: {len(products)} products from {stats['tasks_completed']} pages")
+    return {
+        'products': products,
+        'total_products': len(products),
+        **stats
+    }
@@ -91,8 +91,7 @@ class SmartScrapingStrategy:
         try:
             from src.data.database import DatabaseManager
             db = DatabaseManager()
-            stats = db.get_product_stats()
-            existing_records = stats.get('total_products', 0)
+            existing_records = db.count_products()
             
             if existing_records >= target_records:
                 return {
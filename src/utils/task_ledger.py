@@ -0,0 +1,95 @@
+"""
+Scraping Task Ledger
+
+This module records which (source, keyword, page) search pages have
+already been scraped into an output directory, so resumed runs only
+dispatch pages that have not completed yet.
+"""
+
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Tuple
+
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+Task = Tuple[str, str, int]
+
+class TaskLedger:
+    """
+    SQLite-backed record of completed and failed scraping tasks.
+
+    Outcomes are buffered in memory and written in one transaction by
+    flush(), so tracking never adds a database write per page.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the ledger database.
+
+        Args:
+            db_path: Path to the ledger's SQLite file
+        """
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._pending: List[Tuple[str, str, int, str]] = []
+
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS tasks ("
+                "source TEXT, keyword TEXT, page INTEGER, status TEXT, "
+                "PRIMARY KEY (source, keyword, page))"
+            )
+
+    def filter_new(self, tasks: Iterable[Task]) -> List[Task]:
+        """
+        Drop duplicate tasks and tasks already completed in earlier runs.
+
+        Args:
+            tasks: Candidate (source, keyword, page) tuples
+
+        Returns:
+            Tasks still to run, in their original order
+        """
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            done = set(conn.execute("SELECT source, keyword, page FROM tasks WHERE status = 'done'"))
+
+        fresh = [task for task in dict.fromkeys(tasks) if task not in done]
+        logger.info(f"Task ledger: {len(fresh)} new tasks, {len(done)} already done")
+        return fresh
+
+    def track(self, worker_coro: Callable[[Any, Task], Awaitable[List[Dict[str, Any]]]]):
+        """
+        Wrap a fetch_all worker so each job's outcome is recorded.
+
+        Args:
+            worker_coro: Coroutine ``(session, job) -> list of records``
+
+        Returns:
+            Coroutine with the same signature that also records the outcome
+        """
+        async def tracked(session, job: Task) -> List[Dict[str, Any]]:
+            try:
+                records = await worker_coro(session, job)
+            except Exception:
+                self._pending.append((*job, 'fail'))
+                raise
+            self._pending.append((*job, 'done'))
+            return records
+
+        return tracked
+
+    def flush(self) -> None:
+        """Write buffered task outcomes to the ledger in one transaction."""
+        if not self._pending:
+            return
+
+        with closing(sqlite3.connect(self.db_path)) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO tasks (source, keyword, page, status) VALUES (?, ?, ?, ?)",
+                self._pending
+            )
+        logger.debug(f"Task ledger: recorded {len(self._pending)} outcomes")
+        self._pending.clear()
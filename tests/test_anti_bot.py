@@ -13,7 +13,7 @@ import requests
 from src.scrapers.static_scraper import StaticScraper
 from src.utils.helpers import (
     get_random_user_agent, get_random_headers, random_delay,
-    get_selenium_options, should_use_proxy
+    get_selenium_options, should_use_proxy, parse_retry_after, backoff_delay
 )
 
 class TestAntiBot:
@@ -197,6 +197,16 @@ class TestAntiBot:
                 assert mock_delay.called, "Rate limiting delay not implemented"
                 assert mock_delay.call_count >= 2, f"Delay not called enough times: {mock_delay.call_count}"
     
+    def test_backoff_honours_retry_after(self):
+        """Test that backoff waits at least as long as Retry-After asks."""
+        assert parse_retry_after('3') == 3.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after('not a date') is None
+        
+        assert backoff_delay(0, base=0.25, retry_after=3.0) == 3.0
+        assert 0.125 <= backoff_delay(0, base=0.25) <= 0.375
+        assert 1.0 <= backoff_delay(3, base=0.25) <= 3.0
+    
     def test_captcha_detection_patterns(self):
         """Test CAPTCHA and bot detection patterns."""
         # Load configuration before creating scraper
@@ -0,0 +1,112 @@
+"""
+🧪 CLI Startup Tests
+
+Guards the command-line entry point against eager imports of the heavy
+scraping, database and analysis stacks.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+
+from src.cli.context import CSV_LIST, echo_json, get_cached_manager, machine_output, split_csv
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Modules that must only load once a command actually runs
+HEAVY_MODULES = ['pandas', 'scrapy', 'selenium', 'sqlalchemy']
+
+def _imported_modules(*cli_args):
+    """Run main.py under -X importtime and return the imported module names."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', 'main.py', *cli_args],
+        cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+    
+    return {
+        line.split('|')[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith('import time:')
+    }
+
+class TestCLIStartup:
+    """Test that CLI help stays free of heavy imports."""
+    
+    def test_main_help_skips_heavy_imports(self):
+        """Test that main --help does not import heavy dependencies."""
+        imported = _imported_modules('--help')
+        
+        for module in HEAVY_MODULES:
+            assert module not in imported
+    
+    def test_command_help_skips_heavy_imports(self):
+        """Test that scrape/collect --help only build the option parser."""
+        for command in ('scrape', 'collect'):
+            imported = _imported_modules(command, '--help')
+            
+            for module in HEAVY_MODULES:
+                assert module not in imported
+
+class TestCLIOptionParsing:
+    """Test parsing of comma-separated CLI options."""
+    
+    def test_split_csv_drops_whitespace_and_empty_items(self):
+        """Test that stray spaces and trailing commas are ignored."""
+        assert split_csv('amazon, ebay,') == ['amazon', 'ebay']
+        assert split_csv(' gaming laptop ,phone') == ['gaming laptop', 'phone']
+        assert split_csv('') == []
+    
+    def test_split_csv_drops_repeated_items(self):
+        """Test that repeated items are only kept once, in first-seen order."""
+        assert split_csv('ebay,amazon, ebay') == ['ebay', 'amazon']
+    
+    def test_csv_list_type_converts_during_parsing(self):
+        """Test that the CSV_LIST option type hands commands a list."""
+        assert CSV_LIST.convert('amazon, ebay,', None, None) == ['amazon', 'ebay']
+        assert CSV_LIST.convert(['walmart'], None, None) == ['walmart']
+
+class TestMachineOutput:
+    """Test the --json output mode helpers."""
+    
+    def test_json_mode_keeps_stdout_for_the_result(self, capsys):
+        """Test that progress goes to stderr and only JSON reaches stdout."""
+        with machine_output(True):
+            click.echo("[SUCCESS] Scraping completed!")
+        echo_json({'products_found': 3})
+        
+        captured = capsys.readouterr()
+        assert captured.out == '{"products_found":3}\n'
+        assert '[SUCCESS]' in captured.err
+
+class TestManagerCache:
+    """Test reuse of manager objects across daemon requests."""
+    
+    class _Manager:
+        def __init__(self, keep_warm):
+            self.keep_warm = keep_warm
+            self.shut_down = False
+        
+        def shutdown(self):
+            self.shut_down = True
+    
+    def test_daemon_requests_share_one_warm_manager(self):
+        """Test that requests with the same key get the same kept-warm manager."""
+        managers = {}
+        built = []
+        for _ in range(2):
+            with click.Context(click.Command('turbo'), obj={'managers': managers}) as ctx:
+                built.append(get_cached_manager(ctx, ('turbo', 8), self._Manager))
+        
+        assert built[0] is built[1]
+        assert built[0].keep_warm and not built[0].shut_down
+    
+    def test_single_invocation_shuts_its_manager_down(self):
+        """Test that without the daemon the manager is shut down with the context."""
+        with click.Context(click.Command('turbo'), obj={}) as ctx:
+            manager = get_cached_manager(ctx, ('turbo', 8), self._Manager)
+            assert not manager.keep_warm and not manager.shut_down
+        
+        assert manager.shut_down
@@ -0,0 +1,52 @@
+"""
+Tests for DatabaseManager's single-row and bulk save paths.
+"""
+
+import pytest
+
+from src.data.database import DatabaseManager
+from src.data.models import Product
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Fresh DatabaseManager on a temporary SQLite file (it is a singleton)."""
+    DatabaseManager._instance = None
+    manager = DatabaseManager({'database': {'url': f"sqlite:///{tmp_path / 'products.db'}"}})
+    yield manager
+    manager._engine.dispose()
+    DatabaseManager._instance = None
+
+def _product(title, product_id=None, price=None):
+    # Price history requires a source product id, so id-less products carry no price
+    return {
+        'source': 'ebay',
+        'product_id': product_id,
+        'title': title,
+        'url': f"https://ebay.com/{title}",
+        'price': price
+    }
+
+def _stored(db_manager):
+    with db_manager.get_session() as session:
+        return [(p.product_id, p.title) for p in session.query(Product).order_by(Product.id)]
+
+class TestMissingProductId:
+    """Products without a product_id are matched the same way on both save paths."""
+    
+    def test_bulk_save_updates_row_saved_without_id(self, db_manager):
+        db_manager.save_product(_product('first'))
+        
+        assert db_manager.save_products_bulk([_product('second')]) == 1
+        assert _stored(db_manager) == [(None, 'second')]
+    
+    def test_single_save_updates_row_bulk_saved_without_id(self, db_manager):
+        db_manager.save_products_bulk([_product('first')])
+        db_manager.save_product(_product('second'))
+        
+        assert _stored(db_manager) == [(None, 'second')]
+    
+    def test_repeated_bulk_saves_keep_one_row_without_id(self, db_manager):
+        db_manager.save_products_bulk([_product('first')])
+        db_manager.save_products_bulk([_product('second'), _product('item', product_id='123', price=20.0)])
+        
+        assert _stored(db_manager) == [(None, 'second'), ('123', 'item')]